@@ -780,13 +780,14 @@ def compute_normalized_magnetic_divergence(
     plot_properties = plot_properties_in.copy()
 
     if delta_x is None:
-        # Fetch data information from the solution
-        solution_data = paraview.servermanager.Fetch(solution)
+        # Query the data information instead of fetching the whole solution
+        solution.UpdatePipeline()
+        solution_information = solution.GetDataInformation()
         # Get number of cells
-        n_cells = solution_data.GetNumberOfCells()
+        n_cells = solution_information.GetNumberOfCells()
         n_cells_x = math.sqrt(n_cells)
 
-        solution_bounds = solution_data.GetBounds()
+        solution_bounds = solution_information.GetBounds()
         delta_x = (solution_bounds[1] - solution_bounds[0]) / n_cells_x
 
     quantity = "normalized_magnetic_divergence"
@@ -1496,24 +1497,24 @@ def plot_integrated_quantities_over_time(
     if len(quantities) == 1:
         y_label = plot_properties.quantity_label(quantities[0])
 
-    visible_lines = []
+    visible_quantities = []
     for quantity in quantities:
         if plot_properties.prefix_numeric:
-            visible_lines += [
-                plot_properties.quantity_name(quantity, "numeric_") + " (id=0)"
-            ]
+            visible_quantities.append(
+                plot_properties.quantity_name(quantity, "numeric_")
+            )
         else:
-            visible_lines += [
-                plot_properties.quantity_name(quantity) + " (id=0)"
-            ]
+            visible_quantities.append(plot_properties.quantity_name(quantity))
         if plot_properties.project:
-            visible_lines += [
-                plot_properties.quantity_name(quantity, "project_") + " (id=0)"
-            ]
+            visible_quantities.append(
+                plot_properties.quantity_name(quantity, "project_")
+            )
         if plot_properties.interpol:
-            visible_lines += [
-                plot_properties.quantity_name(quantity, "interpol_") + " (id=0)"
-            ]
+            visible_quantities.append(
+                plot_properties.quantity_name(quantity, "interpol_")
+            )
+    # PlotDataOverTime appends the point id to the series names
+    visible_lines = [name + " (id=0)" for name in visible_quantities]
 
     t_array_name = "Time"
     if t_axes_scale is not None:
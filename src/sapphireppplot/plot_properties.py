@@ -100,6 +100,22 @@ class PlotProperties:
     Frame stride for the animation snapshots.
     Use ``animation_frame_stride = -1`` to disable animations.
     """
+    animation_format: Literal["png", "avi", "ogv", "mp4"] | str = "png"
+    """
+    File format of the animation.
+
+    Image formats like ``"png"`` save a series of files, one per frame.
+    Video formats like ``"avi"``, ``"ogv"`` or ``"mp4"`` encode all frames
+    into a single file.
+    """
+    animation_frame_rate: int = 30
+    """Frame rate (frames per second) for video animation formats."""
+    png_compression_level: int = 5
+    """
+    Compression level for ``.png`` screenshots and animations.
+
+    A value between 0 (fastest write) to 9 (smallest filesize).
+    """
 
     extracts_frame_stride: int = 1
     """Frame stride for the saving extracts."""
@@ -180,6 +196,14 @@ class PlotProperties:
 
     color_map: str = "Viridis (matplotlib)"
     """Select a color map for the color bar."""
+    color_range_over_time: bool = False
+    """
+    Rescale the color map to the data range over all time steps,
+    if no value range is given.
+
+    This scans all time steps once,
+    so the color map stays fixed during animations.
+    """
     color_bar_label_format: str = ""
     """
     The format string for the color bar labels,
@@ -291,6 +315,13 @@ class PlotProperties:
 
     export_precision: int = 5
     """Precision for exporting data, e.g. as CSV"""
+    export_format: Literal["csv", "vtp"] = "csv"
+    """
+    File format for exporting line-outs.
+
+    ``"csv"`` writes plain text. ``"vtp"`` writes VTK PolyData, which is
+    considerably faster to write and to load for large line-outs.
+    """
 
     def copy(self) -> Self:
         """
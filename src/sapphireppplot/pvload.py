@@ -1,6 +1,7 @@
 """Load the solution from files using ParaView."""
 
 import os
+import functools
 from typing import Optional, Literal
 import paraview.simple as ps
 import paraview.servermanager
@@ -21,6 +22,11 @@ def read_parameter_file(
     to allow reading parameter files on a remote data server.
     It can also be used to read any text file.
 
+    The contents are cached as long as the modification time
+    of the file does not change.
+    Files that are not accessible on the local machine,
+    e.g. on a remote data server, are always re-read.
+
     Parameters
     ----------
     results_folder
@@ -37,7 +43,49 @@ def read_parameter_file(
     Raises
     ------
     FileNotFoundError
-        If the parameter file is found in the ``results_folder``.
+        If the parameter file is not found in the ``results_folder``.
+
+    See Also
+    --------
+    invalidate_caches : Clear the cached parameter files.
+    """
+    try:
+        mtime = os.path.getmtime(os.path.join(results_folder, file_name))
+    except OSError:
+        return list(
+            _read_parameter_lines.__wrapped__(results_folder, file_name, None)
+        )
+    return list(_read_parameter_lines(results_folder, file_name, mtime))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_parameter_lines(
+    results_folder: str,
+    file_name: str,
+    mtime: Optional[float],  # noqa: U100
+) -> tuple[str, ...]:
+    """
+    Read the lines of a text file using the ParaView CSV reader.
+
+    Parameters
+    ----------
+    results_folder
+        Path to the folder containing parameter file.
+    file_name
+        File name of the parameter file including file extension.
+    mtime
+        Modification time of the file.
+        Only used as part of the cache key.
+
+    Returns
+    -------
+    prm_lines : tuple[str, ...]
+        Lines of in the parameter file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the parameter file is not found in the ``results_folder``.
     """
     search_pattern = os.path.join(results_folder, file_name)
     prm_file = [search_pattern]
@@ -60,9 +108,9 @@ def read_parameter_file(
         prm_data = paraview.servermanager.Fetch(prm_reader)
         col = prm_data.GetColumn(0)
 
-        prm_lines: list[str] = [""] * col.GetNumberOfValues()
-        for i in range(col.GetNumberOfValues()):
-            prm_lines[i] = col.GetValue(i)
+        prm_lines = tuple(
+            col.GetValue(i) for i in range(col.GetNumberOfValues())
+        )
 
         ps.Delete(prm_reader)
         return prm_lines
@@ -72,6 +120,23 @@ def read_parameter_file(
         ) from exc
 
 
+def invalidate_caches() -> None:
+    """
+    Clear the caches of parameter files and parsed parameter dicts.
+
+    Use this in long-running sessions,
+    e.g. if a parameter file was replaced
+    without changing its modification time.
+
+    See Also
+    --------
+    read_parameter_file : Read contents of a parameter file.
+    sapphireppplot.utils.prm_to_dict : Convert parameter file to a dict.
+    """
+    _read_parameter_lines.cache_clear()
+    utils.clear_prm_cache()
+
+
 def load_csv(
     results_folder: str,
     file_pattern: str = "solution_*.csv",
@@ -149,6 +214,99 @@ def load_csv(
     return solution
 
 
+_READERS: dict[str, tuple[str, str, str, Optional[str], Optional[str]]] = {
+    # file_format: (reader, file name property, file pattern,
+    #               time array, array selection property)
+    "vtk": ("LegacyVTKReader", "FileNames", "*.vtk", None, None),
+    "vtu": (
+        "XMLUnstructuredGridReader",
+        "FileName",
+        "*.vtu",
+        "TIME",
+        "PointArrayStatus",
+    ),
+    "pvtu": (
+        "XMLPartitionedUnstructuredGridReader",
+        "FileName",
+        "*.pvtu",
+        "TIME",
+        "PointArrayStatus",
+    ),
+    "pvtp": (
+        "XMLPartitionedPolydataReader",
+        "FileName",
+        "*.pvtp",
+        "TIME",
+        "PointArrayStatus",
+    ),
+    "xdmf": ("Xdmf3ReaderS", "FileName", ".xdmf", None, "PointArrays"),
+}
+"""
+ParaView readers for the supported solution file formats.
+
+The reader is stored by name and looked up in :py:mod:`paraview.simple`
+when loading, as ParaView regenerates these functions on (re)connection.
+"""
+
+
+def _load_series(
+    results_folder: str,
+    base_file_name: str,
+    file_format: str,
+    load_arrays: Optional[list[str]] = None,
+) -> paraview.servermanager.SourceProxy:
+    """
+    Load series of solution files using the reader for ``file_format``.
+
+    Parameters
+    ----------
+    results_folder
+        Path to the folder containing the solution files.
+    base_file_name
+        Base name of the solutions files.
+    file_format
+        Key of the reader in ``_READERS``.
+    load_arrays
+        The name of the arrays in the solution that should be loaded.
+
+    Returns
+    -------
+    solution : SourceProxy
+        A ParaView reader object with selected point arrays enabled.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no matching files are found in the ``results_folder``.
+    """
+    reader_name, file_property, file_pattern, time_array, array_property = (
+        _READERS[file_format]
+    )
+
+    search_pattern = os.path.join(results_folder, base_file_name + file_pattern)
+    if "*" not in file_pattern and os.path.isfile(search_pattern):
+        # Single fixed file, no need to glob the directory
+        files = [search_pattern]
+    else:
+        # Glob also finds files on a remote data server
+        files = paraview.util.Glob(search_pattern)
+    if not files:
+        raise FileNotFoundError(
+            f"No {file_pattern.lstrip('*')} files found "
+            f"matching '{search_pattern}'"
+        )
+    print(f"Load results in '{search_pattern}'")
+
+    reader = getattr(ps, reader_name)
+    solution = reader(registrationName=base_file_name, **{file_property: files})
+    solution.UpdatePipelineInformation()
+    if load_arrays and array_property is not None:
+        setattr(solution, array_property, load_arrays)
+    if time_array is not None:
+        solution.TimeArray = time_array
+    return solution
+
+
 def load_solution_vtk(
     results_folder: str,
     base_file_name: str = "solution",
@@ -177,24 +335,7 @@ def load_solution_vtk(
     -----
     The 'TimeArray' property is not set.
     """
-    search_pattern = os.path.join(results_folder, base_file_name + "*.vtk")
-    vtk_files = paraview.util.Glob(search_pattern)
-    if not vtk_files:
-        raise FileNotFoundError(
-            f"No .vtk files found matching '{search_pattern}'"
-        )
-    print(f"Load results in '{search_pattern}'")
-
-    # create a new 'Legacy VTK Reader'
-    solution = ps.LegacyVTKReader(
-        registrationName=base_file_name,
-        FileNames=vtk_files,
-    )
-    solution.UpdatePipelineInformation()
-    # if load_arrays:
-    #     solution.PointArrayStatus = load_arrays
-    # solution.TimeArray = "TIME"
-    return solution
+    return _load_series(results_folder, base_file_name, "vtk")
 
 
 def load_solution_vtu(
@@ -224,24 +365,7 @@ def load_solution_vtu(
     FileNotFoundError
         If no ``.vtu`` files are found in the ``results_folder``.
     """
-    search_pattern = os.path.join(results_folder, base_file_name + "*.vtu")
-    vtu_files = paraview.util.Glob(search_pattern)
-    if not vtu_files:
-        raise FileNotFoundError(
-            f"No .vtu files found matching '{search_pattern}'"
-        )
-    print(f"Load results in '{search_pattern}'")
-
-    # create a new 'XML Unstructured Grid Reader'
-    solution = ps.XMLUnstructuredGridReader(
-        registrationName=base_file_name,
-        FileName=vtu_files,
-    )
-    solution.UpdatePipelineInformation()
-    if load_arrays:
-        solution.PointArrayStatus = load_arrays
-    solution.TimeArray = "TIME"
-    return solution
+    return _load_series(results_folder, base_file_name, "vtu", load_arrays)
 
 
 def load_solution_pvtu(
@@ -270,29 +394,8 @@ def load_solution_pvtu(
     ------
     FileNotFoundError
         If no ``.pvtu`` files are found in the ``results_folder``.
-
-    Notes
-    -----
-    The 'TimeArray' property is not set.
     """
-    search_pattern = os.path.join(results_folder, base_file_name + "*.pvtu")
-    pvtu_files = paraview.util.Glob(search_pattern)
-    if not pvtu_files:
-        raise FileNotFoundError(
-            f"No .pvtu files found matching '{search_pattern}'"
-        )
-    print(f"Load results in '{search_pattern}'")
-
-    # create a new 'XML Partitioned Unstructured Grid Reader'
-    solution = ps.XMLPartitionedUnstructuredGridReader(
-        registrationName=base_file_name,
-        FileName=pvtu_files,
-    )
-    solution.UpdatePipelineInformation()
-    if load_arrays:
-        solution.PointArrayStatus = load_arrays
-    solution.TimeArray = "TIME"
-    return solution
+    return _load_series(results_folder, base_file_name, "pvtu", load_arrays)
 
 
 def load_solution_pvtp(
@@ -322,24 +425,7 @@ def load_solution_pvtp(
     FileNotFoundError
         If no ``.pvtp`` files are found in the ``results_folder``.
     """
-    search_pattern = os.path.join(results_folder, base_file_name + "*.pvtp")
-    pvtp_files = paraview.util.Glob(search_pattern)
-    if not pvtp_files:
-        raise FileNotFoundError(
-            f"No .pvtp files found matching '{search_pattern}'"
-        )
-    print(f"Load results in '{search_pattern}'")
-
-    # create a new 'XML Partitioned Unstructured Grid Reader'
-    solution = ps.XMLPartitionedPolydataReader(
-        registrationName=base_file_name,
-        FileName=pvtp_files,
-    )
-    solution.UpdatePipelineInformation()
-    if load_arrays:
-        solution.PointArrayStatus = load_arrays
-    solution.TimeArray = "TIME"
-    return solution
+    return _load_series(results_folder, base_file_name, "pvtp", load_arrays)
 
 
 def load_solution_hdf5_with_xdmf(
@@ -373,24 +459,7 @@ def load_solution_hdf5_with_xdmf(
     -----
     - The 'TimeArray' property is set to "None".
     """
-    search_pattern = os.path.join(results_folder, base_file_name + ".xdmf")
-    xdmf_file = paraview.util.Glob(search_pattern)
-    if not xdmf_file:
-        raise FileNotFoundError(
-            f"No .xdmf file found matching '{search_pattern}'"
-        )
-    print(f"Load results in '{search_pattern}'")
-
-    # create a new 'Xdmf3 Reader S'
-    solution = ps.Xdmf3ReaderS(
-        registrationName=base_file_name,
-        FileName=xdmf_file,
-    )
-    solution.UpdatePipelineInformation()
-    if load_arrays:
-        solution.PointArrays = load_arrays
-    # solution.TimeArray = "TIME"
-    return solution
+    return _load_series(results_folder, base_file_name, "xdmf", load_arrays)
 
 
 def scale_time_steps(
@@ -446,6 +515,79 @@ def scale_time_steps(
     return solution_temporal_scaled
 
 
+_animation_dirty: bool = False
+"""
+Global variable to keep track if the animation scene needs an update.
+"""
+_animation_time: Optional[float] = None
+"""
+Animation time requested by a load with a deferred animation update.
+"""
+
+
+def _defer_animation_update(animation_time: Optional[float]) -> None:
+    """
+    Mark the animation scene for an update by :py:func:`flush_animation`.
+
+    Parameters
+    ----------
+    animation_time
+        Time at which the animation scene should be displayed.
+        ``None`` keeps a time requested by an earlier load.
+    """
+    global _animation_dirty, _animation_time  # pylint: disable=global-statement
+
+    _animation_dirty = True
+    if animation_time is not None:
+        _animation_time = animation_time
+
+
+def flush_animation(
+    animation_time: Optional[float] = None,
+    force: bool = False,
+) -> paraview.servermanager.Proxy:
+    """
+    Update the animation scene to the time steps of all loaded data.
+
+    Updating the animation scene walks all sources in the pipeline.
+    When loading many solutions with ``update_animation=False``,
+    call this function once afterwards.
+
+    Parameters
+    ----------
+    animation_time
+        Set the time at which the animation scene is displayed.
+        Defaults to the time requested by a load with
+        ``update_animation=False``, or to the last time step.
+    force
+        Update the animation scene,
+        even if no data was loaded since the last update.
+
+    Returns
+    -------
+    animation_scene : Proxy
+        The ParaView AnimationScene.
+    """
+    global _animation_dirty, _animation_time  # pylint: disable=global-statement
+
+    animation_scene = ps.GetAnimationScene()
+    if not (_animation_dirty or force):
+        return animation_scene
+
+    if animation_time is None:
+        animation_time = _animation_time
+
+    animation_scene.UpdateAnimationUsingDataTimeSteps()
+    if animation_time is not None:
+        animation_scene.AnimationTime = animation_time
+    else:
+        animation_scene.GoToLast()
+    _animation_dirty = False
+    _animation_time = None
+
+    return animation_scene
+
+
 def load_solution(
     plot_properties: PlotProperties,
     file_format: Literal["vtk", "vtu", "pvtu", "hdf5"] = "vtu",
@@ -455,6 +597,7 @@ def load_solution(
     t_end: float = 1.0,
     animation_time: Optional[float] = None,
     parameter_file_name: Optional[str] = "log.prm",
+    update_animation: bool = True,
 ) -> tuple[
     str,
     ParamDict,
@@ -489,9 +632,16 @@ def load_solution(
     animation_time
         Set the time at which the animation scene is displayed.
         Defaults to the last time step.
+        With ``update_animation=False``,
+        the time is applied by :py:func:`flush_animation`.
     parameter_file_name
         File name of the parameter file including file extension.
         To skip, set ``parameter_file_name = None``.
+    update_animation
+        Update the animation scene to the time steps of all loaded data?
+        When loading many solutions,
+        set ``update_animation=False`` and call :py:func:`flush_animation`
+        once after loading the last one.
 
     Returns
     -------
@@ -514,6 +664,7 @@ def load_solution(
     sapphireppplot.utils.get_results_folder : Prompt for results folder.
     sapphireppplot.plot_properties.PlotProperties.series_names :
         Series names list to load.
+    flush_animation : Update the animation scene.
     """
     results_folder = utils.get_results_folder(path_prefix=path_prefix)
 
@@ -570,12 +721,11 @@ def load_solution(
         case _:
             raise ValueError(f"Unknown file_format: '{file_format}'")
 
-    animation_scene = ps.GetAnimationScene()
-    animation_scene.UpdateAnimationUsingDataTimeSteps()
-    if animation_time is not None:
-        animation_scene.AnimationTime = animation_time
+    if update_animation:
+        animation_scene = flush_animation(animation_time, force=True)
     else:
-        animation_scene.GoToLast()
+        _defer_animation_update(animation_time)
+        animation_scene = ps.GetAnimationScene()
 
     return results_folder, prm, solution, animation_scene
 
@@ -589,6 +739,7 @@ def load_extract(
     subfolder: str = "extracts",
     animation_time: Optional[float] = None,
     parameter_file_name: Optional[str] = "log.prm",
+    update_animation: bool = True,
 ) -> tuple[
     str,
     ParamDict,
@@ -622,9 +773,16 @@ def load_extract(
     animation_time
         Set the time at which the animation scene is displayed.
         Defaults to the last time step.
+        With ``update_animation=False``,
+        the time is applied by :py:func:`flush_animation`.
     parameter_file_name
         File name of the parameter file including file extension.
         To skip, set ``parameter_file_name = None``.
+    update_animation
+        Update the animation scene to the time steps of all loaded data?
+        When loading many solutions,
+        set ``update_animation=False`` and call :py:func:`flush_animation`
+        once after loading the last one.
 
     Returns
     -------
@@ -648,6 +806,7 @@ def load_extract(
     sapphireppplot.plot_properties.PlotProperties.series_names :
         Series names list to load.
     sapphireppplot.transform.save_extracts : Save extracts.
+    flush_animation : Update the animation scene.
     """
     results_folder = utils.get_results_folder(
         path_prefix=path_prefix, results_folder=results_folder
@@ -682,11 +841,10 @@ def load_extract(
         case _:
             raise ValueError(f"Unknown file_format: '{file_format}'")
 
-    animation_scene = ps.GetAnimationScene()
-    animation_scene.UpdateAnimationUsingDataTimeSteps()
-    if animation_time is not None:
-        animation_scene.AnimationTime = animation_time
+    if update_animation:
+        animation_scene = flush_animation(animation_time, force=True)
     else:
-        animation_scene.GoToLast()
+        _defer_animation_update(animation_time)
+        animation_scene = ps.GetAnimationScene()
 
     return results_folder, prm, solution, animation_scene
@@ -1,6 +1,7 @@
 """Create plots using ParaView."""
 
-from typing import Optional, Literal
+from types import TracebackType
+from typing import Any, Optional, Literal, Self
 import os
 from matplotlib.typing import ColorType
 import matplotlib.colors
@@ -10,6 +11,337 @@ from sapphireppplot.plot_properties import PlotProperties
 
 PARAVIEW_DATA_SERVER_LOCATION = 2
 
+_transfer_functions: dict[
+    str,
+    tuple[
+        paraview.servermanager.Proxy,
+        paraview.servermanager.Proxy,
+        paraview.servermanager.Proxy,
+    ],
+] = {}
+"""Cache of the transfer functions of each quantity."""
+_transfer_functions_connection: Optional[paraview.servermanager.Connection] = (
+    None
+)
+"""Connection the cached transfer functions belong to."""
+_color_map_states: dict[str, tuple[tuple[float, float], bool, str]] = {}
+"""Value range, log scale and preset last applied to each color map."""
+_batch_depth: int = 0
+"""Number of active :py:class:`PlotBatch` contexts."""
+_batched_views: list[paraview.servermanager.Proxy] = []
+"""Views with updates deferred to the end of the outermost batch."""
+_batched_camera_resets: list[
+    tuple[
+        paraview.servermanager.Proxy,
+        Literal[2, 3],
+        Optional[list[float]],
+        tuple[bool, float] | Any,
+    ]
+] = []
+"""Camera resets deferred until the batched views are updated."""
+
+
+class PlotBatch:
+    """
+    Defer view updates while building several plots.
+
+    Inside the context, the plotting functions skip updating their views.
+    All views created or modified in the batch are updated and rendered
+    once when leaving the outermost context.
+    The cameras of render views are fit to the data after the update.
+    Saving a screenshot, animation or view inside the context
+    first updates and renders the views batched so far.
+
+    Examples
+    --------
+    >>> with pvplot.PlotBatch():
+    ...     view_rho = pvplot.plot_render_view_2d(solution, layout_rho, "rho")
+    ...     view_p = pvplot.plot_render_view_2d(solution, layout_p, "p")
+    """
+
+    def __enter__(self) -> Self:
+        global _batch_depth  # pylint: disable=global-statement
+
+        _batch_depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],  # noqa: U100
+        traceback: Optional[TracebackType],  # noqa: U100
+    ) -> None:
+        global _batch_depth  # pylint: disable=global-statement
+
+        _batch_depth -= 1
+        if _batch_depth > 0:
+            return
+        if exc_type is not None:
+            _batched_views.clear()
+            _batched_camera_resets.clear()
+            return
+        _flush_batched_views()
+
+
+def _flush_batched_views() -> None:
+    """
+    Update and render the views batched so far.
+
+    The cameras of render views are fit to the data after the update.
+    """
+    views = list(_batched_views)
+    camera_resets = list(_batched_camera_resets)
+    _batched_views.clear()
+    _batched_camera_resets.clear()
+    for view in views:
+        view.Update()
+    for camera_reset in camera_resets:
+        _reset_camera(*camera_reset)
+    for view in views:
+        ps.Render(view)
+
+
+def _update_view(
+    view: paraview.servermanager.Proxy, defer_update: bool = False
+) -> bool:
+    """
+    Update a view, unless the update is deferred.
+
+    Inside a :py:class:`PlotBatch` the update is deferred
+    to the end of the batch, unless it is skipped by ``defer_update``.
+
+    Parameters
+    ----------
+    view
+        The view to update.
+    defer_update
+        Skip updating the view.
+
+    Returns
+    -------
+    updated : bool
+        Whether the view was updated.
+    """
+    if defer_update:
+        return False
+    if _batch_depth > 0:
+        if view not in _batched_views:
+            _batched_views.append(view)
+        return False
+    view.Update()
+    return True
+
+
+def _get_transfer_functions(
+    quantity: str,
+) -> tuple[
+    paraview.servermanager.Proxy,
+    paraview.servermanager.Proxy,
+    paraview.servermanager.Proxy,
+]:
+    """
+    Get the color, opacity and 2D transfer function of a quantity.
+
+    The transfer functions are cached for the active connection,
+    the cache is cleared when connecting to a new session.
+
+    Parameters
+    ----------
+    quantity
+        Name of the quantity.
+
+    Returns
+    -------
+    transfer_color : Proxy
+        Color transfer function/color map.
+    transfer_opacity : Proxy
+        Opacity transfer function/opacity map.
+    transfer_function : Proxy
+        2D transfer function.
+    """
+    global _transfer_functions_connection  # pylint: disable=global-statement
+
+    connection = paraview.servermanager.ActiveConnection
+    if connection is not _transfer_functions_connection:
+        _transfer_functions.clear()
+        _color_map_states.clear()
+        _transfer_functions_connection = connection
+
+    if quantity not in _transfer_functions:
+        _transfer_functions[quantity] = (
+            ps.GetColorTransferFunction(quantity),
+            ps.GetOpacityTransferFunction(quantity),
+            ps.GetTransferFunction2D(quantity),
+        )
+    return _transfer_functions[quantity]
+
+
+def _split_vector_component(quantity: str) -> tuple[str, str]:
+    """
+    Split the vector component suffix from a quantity.
+
+    Parameters
+    ----------
+    quantity
+        Name of the quantity,
+        optionally with the suffix ``_X/Y/Z`` or ``_Magnitude``.
+
+    Returns
+    -------
+    base_quantity : str
+        Name of the quantity without suffix.
+    vec_component : str
+        Vector component, empty for scalar quantities.
+    """
+    base_quantity, separator, vec_component = quantity.rpartition("_")
+    if separator and vec_component in ("X", "Y", "Z", "Magnitude"):
+        return base_quantity, vec_component
+    return quantity, ""
+
+
+def _apply_color_map(
+    display: paraview.servermanager.Proxy,
+    view: paraview.servermanager.Proxy,
+    quantity: str,
+    value_range: Optional[tuple[float, float]] = None,
+    log_scale: bool = False,
+    plot_properties: Optional[PlotProperties] = None,
+    color_bar_visible: bool = True,
+) -> paraview.servermanager.Proxy:
+    """
+    Color a display by a quantity and configure its color bar.
+
+    Shared by the 2D and 3D render views.
+
+    Parameters
+    ----------
+    display
+        The display to color.
+    view
+        The render view showing the display.
+    quantity
+        Name of the quantity to color by.
+        For vector quantities, the shown component can be selected by the suffix
+        ``_X/Y/Z`` or ``_Magnitude``.
+    value_range
+        Minimal (``value_range[0]``)
+        and maximal (``value_range[1]``) value for the color bar.
+    log_scale
+        Use a logarithmic color scale?
+    plot_properties
+        Properties for plotting like the labels.
+    color_bar_visible
+        Should the color bar be shown?
+
+    Returns
+    -------
+    color_bar : Proxy
+        The configured color bar.
+    """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
+    base_quantity, vec_component = _split_vector_component(quantity)
+
+    # set scalar coloring
+    ps.ColorBy(
+        display,
+        (plot_properties.data_type, base_quantity, vec_component),
+    )
+
+    # show color bar/color legend
+    display.SetScalarBarVisibility(view, True)
+
+    # get color, opacity and 2D transfer function
+    transfer_color, transfer_opacity, transfer_function = (
+        _get_transfer_functions(base_quantity)
+    )
+
+    # Skip the rescale and preset,
+    # if the color map is still in the state of a previous plot
+    state = None
+    if value_range:
+        state = (
+            (value_range[0], value_range[1]),
+            log_scale,
+            plot_properties.color_map,
+        )
+    rgb_points = transfer_color.RGBPoints
+    if (
+        state is None
+        or _color_map_states.get(base_quantity) != state
+        or (rgb_points[0], rgb_points[-4]) != state[0]
+    ):
+        # Rescale transfer function
+        if value_range:
+            for transfer, args in (
+                (transfer_color, (value_range[0], value_range[1])),
+                (transfer_opacity, (value_range[0], value_range[1])),
+                (
+                    transfer_function,
+                    (value_range[0], value_range[1], 0.0, 1.0),
+                ),
+            ):
+                transfer.RescaleTransferFunction(*args)
+        elif plot_properties.color_range_over_time:
+            display.RescaleTransferFunctionToDataRangeOverTime()
+
+        # convert to log space
+        if log_scale:
+            transfer_color.MapControlPointsToLogSpace()
+            transfer_color.UseLogScale = 1
+
+        transfer_color.ApplyPreset(plot_properties.color_map, True)
+
+        if state is None:
+            _color_map_states.pop(base_quantity, None)
+        else:
+            _color_map_states[base_quantity] = state
+
+    # get color bar
+    color_bar = ps.GetScalarBar(transfer_color, view)
+
+    # Properties modified on color_bar
+    ps.SetProperties(
+        color_bar,
+        Title=plot_properties.labels.get(quantity, quantity),
+        ComponentTitle="",
+    )
+    color_bar_visible = (
+        plot_properties.configure_color_bar(color_bar) and color_bar_visible
+    )
+    display.SetScalarBarVisibility(view, color_bar_visible)
+
+    return color_bar
+
+
+def _set_preview_size(
+    layout: paraview.servermanager.ViewLayoutProxy,
+    preview_size: tuple[float, float],
+) -> None:
+    """
+    Enter preview mode and set the layout size.
+
+    Entering the preview mode already resizes the layout,
+    therefore the layout is only resized if its size does not match.
+
+    Parameters
+    ----------
+    layout
+        ParaView layout to resize.
+    preview_size
+        Preview size in pixels.
+        Use ``preview_size = (0, 0)`` to deactivate preview mode.
+    """
+    layout.PreviewMode = list(preview_size)
+    # layout/tab size in pixels
+    if (
+        preview_size[0] != 0
+        and preview_size[1] != 0
+        and list(layout.GetSize()) != list(preview_size)
+    ):
+        layout.SetSize(*preview_size)
+
 
 def plot_line_chart_view(
     solution: paraview.servermanager.SourceProxy,
@@ -23,7 +355,7 @@ def plot_line_chart_view(
     log_x_scale: bool = False,
     log_y_scale: bool = False,
     line_chart_view: Optional[paraview.servermanager.Proxy] = None,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
 ) -> paraview.servermanager.Proxy:
     """
     Create and configure line chart view in ParaView.
@@ -63,12 +395,16 @@ def plot_line_chart_view(
     line_chart_view : XYChartViewProxy
         The configured XY chart view.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
     if line_chart_view is None:
         # Create a new 'Line Chart View'
         line_chart_view = ps.CreateView("XYChartView")
 
-    line_chart_view.BottomAxisTitle = x_label
-    line_chart_view.LeftAxisTitle = y_label
+    ps.SetProperties(
+        line_chart_view, BottomAxisTitle=x_label, LeftAxisTitle=y_label
+    )
     plot_properties.configure_line_chart_view_axes(line_chart_view)
 
     # assign view to a particular cell in the layout
@@ -84,40 +420,196 @@ def plot_line_chart_view(
         solution, line_chart_view, "XYChartRepresentation"
     )
     # Enter preview mode
-    layout.PreviewMode = list(plot_properties.preview_size_1d)
-    # layout/tab size in pixels
-    if (
-        plot_properties.preview_size_1d[0] != 0
-        and plot_properties.preview_size_1d[1] != 0
-    ):
-        layout.SetSize(
-            plot_properties.preview_size_1d[0],
-            plot_properties.preview_size_1d[1],
-        )
+    _set_preview_size(layout, plot_properties.preview_size_1d)
 
     # Properties modified on solution_display
-    solution_display.UseIndexForXAxis = 0
-    solution_display.XArrayName = x_array_name
+    ps.SetProperties(
+        solution_display, UseIndexForXAxis=0, XArrayName=x_array_name
+    )
     plot_properties.configure_line_chart_view_display(solution_display)
-    if visible_lines:
+    # only push the visible series if they differ from the current ones
+    if visible_lines and list(solution_display.SeriesVisibility) != list(
+        visible_lines
+    ):
         solution_display.SeriesVisibility = visible_lines
 
+    # Properties modified on line_chart_view
+    view_properties: dict[str, Any] = {}
     if x_range:
-        line_chart_view.BottomAxisUseCustomRange = 1
-        line_chart_view.BottomAxisRangeMinimum = x_range[0]
-        line_chart_view.BottomAxisRangeMaximum = x_range[1]
+        view_properties.update(
+            BottomAxisUseCustomRange=1,
+            BottomAxisRangeMinimum=x_range[0],
+            BottomAxisRangeMaximum=x_range[1],
+        )
     if value_range:
-        line_chart_view.LeftAxisUseCustomRange = 1
-        line_chart_view.LeftAxisRangeMinimum = value_range[0]
-        line_chart_view.LeftAxisRangeMaximum = value_range[1]
+        view_properties.update(
+            LeftAxisUseCustomRange=1,
+            LeftAxisRangeMinimum=value_range[0],
+            LeftAxisRangeMaximum=value_range[1],
+        )
     if log_x_scale:
-        line_chart_view.BottomAxisLogScale = 1
+        view_properties["BottomAxisLogScale"] = 1
     if log_y_scale:
-        line_chart_view.LeftAxisLogScale = 1
+        view_properties["LeftAxisLogScale"] = 1
+    if view_properties:
+        ps.SetProperties(line_chart_view, **view_properties)
 
     return line_chart_view
 
 
+def _reset_camera(
+    render_view: paraview.servermanager.Proxy,
+    dimension: Literal[2, 3],
+    camera_direction: Optional[list[float]],
+    camera_view: tuple[bool, float] | Any,
+) -> None:
+    """
+    Set the camera direction and fit the camera to the data.
+
+    The view has to be updated before, otherwise the camera is not fit
+    to the current data.
+
+    Parameters
+    ----------
+    render_view
+        The render view.
+    dimension
+        Dimension of the render view.
+        3D views use an isometric view if no direction is given.
+    camera_direction
+        Direction of the camera.
+    camera_view
+        Arguments passed to ``render_view.ResetCamera()``.
+    """
+    if dimension == 3 and not camera_direction:
+        render_view.ApplyIsometricView()
+    else:
+        ps.ResetCameraToDirection(direction=camera_direction, view=render_view)
+
+    # reset view to fit data
+    render_view.ResetCamera(*camera_view)
+
+
+def _update_render_view(
+    render_view: paraview.servermanager.Proxy,
+    dimension: Literal[2, 3],
+    camera_direction: Optional[list[float]],
+    camera_view: tuple[bool, float] | Any,
+    defer_update: bool = False,
+) -> None:
+    """
+    Update a render view and fit the camera to the data.
+
+    The camera can only be fit to the data of an updated view.
+    Inside a :py:class:`PlotBatch` the camera reset is deferred
+    to the end of the batch, with ``defer_update`` it is skipped.
+
+    Parameters
+    ----------
+    render_view
+        The render view.
+    dimension
+        Dimension of the render view.
+    camera_direction
+        Direction of the camera.
+    camera_view
+        Arguments passed to ``render_view.ResetCamera()``.
+    defer_update
+        Skip updating the view and resetting the camera.
+    """
+    if _update_view(render_view, defer_update):
+        _reset_camera(render_view, dimension, camera_direction, camera_view)
+    elif _batch_depth > 0 and not defer_update:
+        # Only the last plot in a view determines its camera
+        _batched_camera_resets[:] = [
+            camera_reset
+            for camera_reset in _batched_camera_resets
+            if camera_reset[0] != render_view
+        ]
+        _batched_camera_resets.append(
+            (render_view, dimension, camera_direction, camera_view)
+        )
+
+
+def _create_render_view(
+    solution: paraview.servermanager.SourceProxy,
+    layout: paraview.servermanager.ViewLayoutProxy,
+    render_view: Optional[paraview.servermanager.Proxy],
+    dimension: Literal[2, 3],
+    plot_properties: PlotProperties,
+) -> tuple[paraview.servermanager.Proxy, paraview.servermanager.Proxy]:
+    """
+    Create a 2D/3D render view and show the solution without coloring.
+
+    Parameters
+    ----------
+    solution
+        The data source to visualize, typically a ParaView data object.
+    layout
+        ParaView layout to use for the plot.
+    render_view
+        If a render view is given, add the plot to it.
+        Otherwise create a new one.
+    dimension
+        Create a 2D or 3D render view?
+    plot_properties
+        Properties for plotting like the grid.
+
+    Returns
+    -------
+    render_view : RenderViewProxy
+        The 2D/3D render view.
+    solution_display : Proxy
+        The display of the solution in the render view.
+    """
+    if render_view is None:
+        # Create a new 'Render View'
+        render_view = ps.CreateView("RenderView")
+
+    # assign view to a particular cell in the layout
+    ps.AssignViewToLayout(view=render_view, layout=layout, hint=0)
+
+    # set active view
+    ps.SetActiveView(render_view)
+    # set active source
+    ps.SetActiveSource(solution)
+
+    # show data in view
+    solution_display = ps.Show(
+        solution, render_view, plot_properties.representation_type
+    )
+    # Enter preview mode
+    _set_preview_size(
+        layout,
+        (
+            plot_properties.preview_size_2d
+            if dimension == 2
+            else plot_properties.preview_size_3d
+        ),
+    )
+
+    # Properties modified on render_view:
+    # hide orientation axes, set interaction mode and white background
+    ps.SetProperties(
+        render_view,
+        OrientationAxesVisibility=0,
+        InteractionMode=f"{dimension}D",
+        UseColorPaletteForBackground=0,
+        BackgroundColorMode="Single Color",
+        Background=[1.0, 1.0, 1.0],
+    )
+
+    # Properties modified on solution_display
+    ps.SetProperties(solution_display, DisableLighting=1, Diffuse=1.0)
+
+    if dimension == 2:
+        plot_properties.configure_grid_2d(render_view, solution_display)
+    else:
+        plot_properties.configure_grid_3d(render_view, solution_display)
+
+    return render_view, solution_display
+
+
 def plot_render_view_2d(
     solution: paraview.servermanager.SourceProxy,
     layout: paraview.servermanager.ViewLayoutProxy,
@@ -126,7 +618,8 @@ def plot_render_view_2d(
     log_scale: bool = False,
     camera_direction: Optional[list[float]] = None,
     render_view: Optional[paraview.servermanager.Proxy] = None,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
+    defer_update: bool = False,
 ) -> paraview.servermanager.Proxy:
     """
     Create and configure 2D render view in ParaView.
@@ -155,6 +648,12 @@ def plot_render_view_2d(
         Otherwise create a new one.
     plot_properties
         Properties for plotting like the labels.
+    defer_update
+        Skip updating the view.
+        Use this when creating many plots
+        and update and render the views only once afterwards.
+        The camera is then not fit to the data
+        and has to be reset after updating the view.
 
     Returns
     -------
@@ -166,124 +665,31 @@ def plot_render_view_2d(
     :pv:`paraview.simple.ResetCameraToDirection <paraview.simple.html#paraview.simple.ResetCameraToDirection>` :
         ParaView method to set camera direction.
     """
-    if render_view is None:
-        # Create a new 'Render View'
-        render_view = ps.CreateView("RenderView")
-
-    # assign view to a particular cell in the layout
-    ps.AssignViewToLayout(view=render_view, layout=layout, hint=0)
+    if plot_properties is None:
+        plot_properties = PlotProperties()
 
-    # set active view
-    ps.SetActiveView(render_view)
-    # set active source
-    ps.SetActiveSource(solution)
-
-    # show data in view
-    solution_display = ps.Show(
-        solution, render_view, plot_properties.representation_type
+    render_view, solution_display = _create_render_view(
+        solution, layout, render_view, 2, plot_properties
     )
-    # Enter preview mode
-    layout.PreviewMode = list(plot_properties.preview_size_2d)
-    # layout/tab size in pixels
-    if (
-        plot_properties.preview_size_2d[0] != 0
-        and plot_properties.preview_size_2d[1] != 0
-    ):
-        layout.SetSize(
-            plot_properties.preview_size_2d[0],
-            plot_properties.preview_size_2d[1],
-        )
-
-    # update the view to ensure updated data information
-    render_view.Update()
-
-    ps.ResetCameraToDirection(direction=camera_direction, view=render_view)
-
-    # reset view to fit data
-    render_view.ResetCamera(*plot_properties.camera_view_2d)
-
-    # Hide orientation axes
-    render_view.OrientationAxesVisibility = 0
-
-    # changing interaction mode based on data extents
-    render_view.InteractionMode = "2D"
-
-    # Properties modified on render_view
-    render_view.UseColorPaletteForBackground = 0
-    render_view.BackgroundColorMode = "Single Color"
-    render_view.Background = [1.0, 1.0, 1.0]
-
-    # Properties modified on solution_display
-    solution_display.DisableLighting = 1
-    solution_display.Diffuse = 1.0
-
-    plot_properties.configure_grid_2d(render_view, solution_display)
 
-    # reset view to fit data
-    render_view.ResetCamera(*plot_properties.camera_view_2d)
-
-    # update the view to ensure updated data information
-    render_view.Update()
-
-    vec_component = ""
-    base_quantity = quantity
-    if quantity.endswith("_Magnitude"):
-        vec_component = "Magnitude"
-        base_quantity = quantity.removesuffix("_Magnitude")
-    elif quantity.endswith("_X"):
-        vec_component = "X"
-        base_quantity = quantity.removesuffix("_X")
-    elif quantity.endswith("_Y"):
-        vec_component = "Y"
-        base_quantity = quantity.removesuffix("_Y")
-    elif quantity.endswith("_Z"):
-        vec_component = "Z"
-        base_quantity = quantity.removesuffix("_Z")
-
-    # set scalar coloring
-    ps.ColorBy(
+    # set scalar coloring and configure color bar
+    _apply_color_map(
         solution_display,
-        (plot_properties.data_type, base_quantity, vec_component),
+        render_view,
+        quantity,
+        value_range=value_range,
+        log_scale=log_scale,
+        plot_properties=plot_properties,
     )
 
-    # region Configure color bar
-    # show color bar/color legend
-    solution_display.SetScalarBarVisibility(render_view, True)
-
-    # get color transfer function/color map
-    transfer_color = ps.GetColorTransferFunction(base_quantity)
-    # get opacity transfer function/opacity map
-    transfer_opacity = ps.GetOpacityTransferFunction(base_quantity)
-    # get 2D transfer function
-    transfer_function = ps.GetTransferFunction2D(base_quantity)
-
-    # Rescale transfer function
-    if value_range:
-        transfer_color.RescaleTransferFunction(value_range[0], value_range[1])
-        transfer_opacity.RescaleTransferFunction(value_range[0], value_range[1])
-        transfer_function.RescaleTransferFunction(
-            value_range[0], value_range[1], 0.0, 1.0
-        )
-
-    # convert to log space
-    if log_scale:
-        transfer_color.MapControlPointsToLogSpace()
-        transfer_color.UseLogScale = 1
-
-    transfer_color.ApplyPreset(plot_properties.color_map, True)
-
-    # get color bar
-    color_bar = ps.GetScalarBar(transfer_color, render_view)
-
-    # Properties modified on color_bar
-    if quantity in plot_properties.labels.keys():
-        color_bar.Title = plot_properties.labels[quantity]
-    else:
-        color_bar.Title = quantity
-    color_bar.ComponentTitle = ""
-    color_bar_visible = plot_properties.configure_color_bar(color_bar)
-    solution_display.SetScalarBarVisibility(render_view, color_bar_visible)
-    # endregion
+    # update the view once all properties are set and fit the camera
+    _update_render_view(
+        render_view,
+        2,
+        camera_direction,
+        plot_properties.camera_view_2d,
+        defer_update,
+    )
 
     return render_view
 
@@ -296,7 +702,8 @@ def plot_render_view_3d(
     log_scale: bool = False,
     camera_direction: Optional[list[float]] = None,
     render_view: Optional[paraview.servermanager.Proxy] = None,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
+    defer_update: bool = False,
 ) -> paraview.servermanager.Proxy:
     """
     Create and configure 3D render view in ParaView.
@@ -326,6 +733,12 @@ def plot_render_view_3d(
         Otherwise create a new one.
     plot_properties
         Properties for plotting like the labels.
+    defer_update
+        Skip updating the view.
+        Use this when creating many plots
+        and update and render the views only once afterwards.
+        The camera is then not fit to the data
+        and has to be reset after updating the view.
 
     Returns
     -------
@@ -337,127 +750,31 @@ def plot_render_view_3d(
     :pv:`paraview.simple.ResetCameraToDirection <paraview.simple.html#paraview.simple.ResetCameraToDirection>` :
         ParaView method to set camera direction.
     """
-    if render_view is None:
-        # Create a new 'Render View'
-        render_view = ps.CreateView("RenderView")
+    if plot_properties is None:
+        plot_properties = PlotProperties()
 
-    # assign view to a particular cell in the layout
-    ps.AssignViewToLayout(view=render_view, layout=layout, hint=0)
-
-    # set active view
-    ps.SetActiveView(render_view)
-    # set active source
-    ps.SetActiveSource(solution)
-
-    # show data in view
-    solution_display = ps.Show(
-        solution, render_view, plot_properties.representation_type
+    render_view, solution_display = _create_render_view(
+        solution, layout, render_view, 3, plot_properties
     )
-    # Enter preview mode
-    layout.PreviewMode = list(plot_properties.preview_size_3d)
-    # layout/tab size in pixels
-    if (
-        plot_properties.preview_size_3d[0] != 0
-        and plot_properties.preview_size_3d[1] != 0
-    ):
-        layout.SetSize(
-            plot_properties.preview_size_3d[0],
-            plot_properties.preview_size_3d[1],
-        )
-
-    # update the view to ensure updated data information
-    render_view.Update()
-
-    if camera_direction:
-        ps.ResetCameraToDirection(direction=camera_direction, view=render_view)
-    else:
-        render_view.ApplyIsometricView()
-
-    # reset view to fit data
-    render_view.ResetCamera(*plot_properties.camera_view_3d)
 
-    # Hide orientation axes
-    render_view.OrientationAxesVisibility = 0
-
-    # changing interaction mode based on data extents
-    render_view.InteractionMode = "3D"
-
-    # Properties modified on render_view
-    render_view.UseColorPaletteForBackground = 0
-    render_view.BackgroundColorMode = "Single Color"
-    render_view.Background = [1.0, 1.0, 1.0]
-
-    # Properties modified on solution_display
-    solution_display.DisableLighting = 1
-    solution_display.Diffuse = 1.0
-
-    plot_properties.configure_grid_3d(render_view, solution_display)
-
-    # reset view to fit data
-    render_view.ResetCamera(*plot_properties.camera_view_3d)
-
-    # update the view to ensure updated data information
-    render_view.Update()
-
-    vec_component = ""
-    base_quantity = quantity
-    if quantity.endswith("_Magnitude"):
-        vec_component = "Magnitude"
-        base_quantity = quantity.removesuffix("_Magnitude")
-    elif quantity.endswith("_X"):
-        vec_component = "X"
-        base_quantity = quantity.removesuffix("_X")
-    elif quantity.endswith("_Y"):
-        vec_component = "Y"
-        base_quantity = quantity.removesuffix("_Y")
-    elif quantity.endswith("_Z"):
-        vec_component = "Z"
-        base_quantity = quantity.removesuffix("_Z")
-
-    # set scalar coloring
-    ps.ColorBy(
+    # set scalar coloring and configure color bar
+    _apply_color_map(
         solution_display,
-        (plot_properties.data_type, base_quantity, vec_component),
+        render_view,
+        quantity,
+        value_range=value_range,
+        log_scale=log_scale,
+        plot_properties=plot_properties,
     )
 
-    # region Configure color bar
-    # show color bar/color legend
-    solution_display.SetScalarBarVisibility(render_view, True)
-
-    # get color transfer function/color map
-    transfer_color = ps.GetColorTransferFunction(base_quantity)
-    # get opacity transfer function/opacity map
-    transfer_opacity = ps.GetOpacityTransferFunction(base_quantity)
-    # get 2D transfer function
-    transfer_function = ps.GetTransferFunction2D(base_quantity)
-
-    # Rescale transfer function
-    if value_range:
-        transfer_color.RescaleTransferFunction(value_range[0], value_range[1])
-        transfer_opacity.RescaleTransferFunction(value_range[0], value_range[1])
-        transfer_function.RescaleTransferFunction(
-            value_range[0], value_range[1], 0.0, 1.0
-        )
-
-    # convert to log space
-    if log_scale:
-        transfer_color.MapControlPointsToLogSpace()
-        transfer_color.UseLogScale = 1
-
-    transfer_color.ApplyPreset(plot_properties.color_map, True)
-
-    # get color bar
-    color_bar = ps.GetScalarBar(transfer_color, render_view)
-
-    # Properties modified on color_bar
-    if quantity in plot_properties.labels.keys():
-        color_bar.Title = plot_properties.labels[quantity]
-    else:
-        color_bar.Title = quantity
-    color_bar.ComponentTitle = ""
-    color_bar_visible = plot_properties.configure_color_bar(color_bar)
-    solution_display.SetScalarBarVisibility(render_view, color_bar_visible)
-    # endregion
+    # update the view once all properties are set and fit the camera
+    _update_render_view(
+        render_view,
+        3,
+        camera_direction,
+        plot_properties.camera_view_3d,
+        defer_update,
+    )
 
     return render_view
 
@@ -469,7 +786,8 @@ def show_overlay_2d(
     color_bar_visible: bool = False,
     value_range: Optional[tuple[float, float]] = None,
     log_scale: bool = False,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
+    defer_update: bool = False,
 ) -> paraview.servermanager.Proxy:
     """
     Show a contour lines or stream tracer overlay in a 2D render view.
@@ -492,6 +810,10 @@ def show_overlay_2d(
         Use a logarithmic color scale?
     plot_properties
         Properties for plotting like the labels.
+    defer_update
+        Skip updating the view.
+        Use this when creating many plots
+        and update and render the views only once afterwards.
 
     Returns
     -------
@@ -503,6 +825,9 @@ def show_overlay_2d(
     sapphireppplot.transform.contour_lines : Create contour lines.
     sapphireppplot.transform.stream_tracer : Create stream tracer.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
     # set active view
     ps.SetActiveView(render_view)
 
@@ -510,52 +835,26 @@ def show_overlay_2d(
     solution_display = ps.Show(
         source, render_view, plot_properties.representation_type
     )
-    # update the view to ensure updated data information
-    render_view.Update()
-
-    # set scalar coloring
-    ps.ColorBy(solution_display, (plot_properties.data_type, quantity))
-
     if quantity is None:
+        # use solid color
+        solution_display.ColorArrayName = [plot_properties.data_type, ""]
+        # update the view to ensure updated data information
+        _update_view(render_view, defer_update)
         return render_view
 
-    # region Configure color bar
-    # show color bar/color legend
-    solution_display.SetScalarBarVisibility(render_view, True)
-
-    # get color transfer function/color map
-    transfer_color = ps.GetColorTransferFunction(quantity)
-    # get opacity transfer function/opacity map
-    transfer_opacity = ps.GetOpacityTransferFunction(quantity)
-    # get 2D transfer function
-    transfer_function = ps.GetTransferFunction2D(quantity)
-
-    # Rescale transfer function
-    if value_range:
-        transfer_color.RescaleTransferFunction(value_range[0], value_range[1])
-        transfer_opacity.RescaleTransferFunction(value_range[0], value_range[1])
-        transfer_function.RescaleTransferFunction(
-            value_range[0], value_range[1], 0.0, 1.0
-        )
-
-    # convert to log space
-    if log_scale:
-        transfer_color.MapControlPointsToLogSpace()
-        transfer_color.UseLogScale = 1
-
-    transfer_color.ApplyPreset(plot_properties.color_map, True)
+    # set scalar coloring and configure color bar
+    _apply_color_map(
+        solution_display,
+        render_view,
+        quantity,
+        value_range=value_range,
+        log_scale=log_scale,
+        plot_properties=plot_properties,
+        color_bar_visible=color_bar_visible,
+    )
 
-    # get color bar
-    color_bar = ps.GetScalarBar(transfer_color, render_view)
-
-    # Properties modified on color_bar
-    if plot_properties.labels[quantity]:
-        color_bar.Title = plot_properties.labels[quantity]
-    else:
-        color_bar.Title = quantity
-    plot_properties.configure_color_bar(color_bar)
-    solution_display.SetScalarBarVisibility(render_view, color_bar_visible)
-    # endregion
+    # update the view once all properties are set
+    _update_view(render_view, defer_update)
 
     return render_view
 
@@ -565,7 +864,8 @@ def show_outline(
     render_view: paraview.servermanager.Proxy,
     color: Optional[ColorType] = None,
     line_width: float = 2.0,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
+    defer_update: bool = False,
 ) -> paraview.servermanager.SourceProxy:
     """
     Show outlines of the solution a 2D/3D render view.
@@ -585,6 +885,10 @@ def show_outline(
         Line width for the outline.
     plot_properties
         Properties for plotting like grid color.
+    defer_update
+        Skip updating the view.
+        Use this when creating many plots
+        and update and render the views only once afterwards.
 
     Returns
     -------
@@ -595,6 +899,9 @@ def show_outline(
     --------
     sapphireppplot.plot_properties.PlotProperties.grid_color : Color for grid.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
     if color is None:
         color = plot_properties.grid_color
     # set active view
@@ -605,19 +912,59 @@ def show_outline(
 
     # show outline in view
     outline_display = ps.Show(outline, render_view, "GeometryRepresentation")
-    outline_display.Representation = "Outline"
+
+    # set representation, color, line width and ensure visibility
+    color_rgb = matplotlib.colors.to_rgb(color)
+    ps.SetProperties(
+        outline_display,
+        Representation="Outline",
+        AmbientColor=color_rgb,
+        DiffuseColor=color_rgb,
+        LineWidth=line_width,
+        RenderLinesAsTubes=1,
+    )
     # update the view to ensure updated data information
-    render_view.Update()
+    _update_view(render_view, defer_update)
 
-    # set color
-    outline_display.AmbientColor = matplotlib.colors.to_rgb(color)
-    outline_display.DiffuseColor = matplotlib.colors.to_rgb(color)
+    return outline
 
-    # set line width and ensure visibility
-    outline_display.LineWidth = line_width
-    outline_display.RenderLinesAsTubes = 1
 
-    return outline
+def _configure_annotation_display(
+    display: paraview.servermanager.Proxy,
+    location: str | tuple[float, float],
+    font_size: int,
+    is_line_chart_view: bool,
+    plot_properties: PlotProperties,
+) -> None:
+    """
+    Set font and position of a text or time annotation.
+
+    Parameters
+    ----------
+    display
+        Text representation of the annotation.
+    location
+        Descriptive location string or coordinates.
+    font_size
+        Font size of the annotation.
+    is_line_chart_view
+        Whether the annotation is shown in a line chart view.
+    plot_properties
+        Properties for plotting like the color.
+    """
+    location_property = (
+        "LabelLocation" if is_line_chart_view else "WindowLocation"
+    )
+    display_properties: dict[str, Any] = {
+        "FontSize": font_size,
+        "Color": matplotlib.colors.to_rgb(plot_properties.text_color),
+    }
+    if isinstance(location, str):
+        display_properties[location_property] = location
+    else:
+        display_properties[location_property] = "Any Location"
+        display_properties["Position"] = list(location)
+    ps.SetProperties(display, **display_properties)
 
 
 def display_text(
@@ -634,7 +981,8 @@ def display_text(
         ]
         | tuple[float, float]
     ) = "Upper Center",
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
+    defer_update: bool = False,
 ) -> paraview.servermanager.Proxy:
     """
     Display text on a view.
@@ -650,12 +998,19 @@ def display_text(
         Either descriptive string or coordinates.
     plot_properties
         Properties for plotting like the color.
+    defer_update
+        Skip updating the view.
+        Use this when creating many plots
+        and update and render the views only once afterwards.
 
     Returns
     -------
     text_proxy : Proxy
         The text proxy.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
     is_line_char_view = view.IsA("vtkSMContextViewProxy")
 
     # create a new 'Text'
@@ -671,33 +1026,24 @@ def display_text(
         text_display = ps.Show(text_proxy, view, "TextSourceRepresentation")
 
     # Properties modified on text_display
-    text_display.FontSize = plot_properties.text_size
-    text_display.Color = matplotlib.colors.to_rgb(plot_properties.text_color)
-    if is_line_char_view:
-        match location:
-            case str():
-                text_display.LabelLocation = location
-            case _:
-                text_display.LabelLocation = "Any Location"
-                text_display.Position = list(location)
-    else:
-        match location:
-            case str():
-                text_display.WindowLocation = location
-            case _:
-                text_display.WindowLocation = "Any Location"
-                text_display.Position = list(location)
+    _configure_annotation_display(
+        text_display,
+        location,
+        plot_properties.text_size,
+        is_line_char_view,
+        plot_properties,
+    )
 
-    view.Update()
     # Fix for correct positioning
-    if is_line_char_view:
+    if _update_view(view, defer_update) and is_line_char_view:
         ps.Render(view)
     return text_proxy
 
 
 def display_time(
     view: paraview.servermanager.Proxy,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
+    defer_update: bool = False,
 ) -> paraview.servermanager.Proxy:
     """
     Display the animation time.
@@ -708,12 +1054,19 @@ def display_time(
         ParaView view to display the text.
     plot_properties
         Properties for plotting like the color.
+    defer_update
+        Skip updating the view.
+        Use this when creating many plots
+        and update and render the views only once afterwards.
 
     Returns
     -------
     annotate_time : Proxy
         The text proxy.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
     is_line_char_view = view.IsA("vtkSMContextViewProxy")
 
     # create a new 'Annotate Time'
@@ -729,26 +1082,16 @@ def display_time(
         time_display = ps.Show(annotate_time, view, "TextSourceRepresentation")
 
     # Properties modified on time_display
-    time_display.FontSize = plot_properties.label_size
-    time_display.Color = matplotlib.colors.to_rgb(plot_properties.text_color)
-    if is_line_char_view:
-        match plot_properties.time_location:
-            case str():
-                time_display.LabelLocation = plot_properties.time_location
-            case _:
-                time_display.LabelLocation = "Any Location"
-                time_display.Position = list(plot_properties.time_location)
-    else:
-        match plot_properties.time_location:
-            case str():
-                time_display.WindowLocation = plot_properties.time_location
-            case _:
-                time_display.WindowLocation = "Any Location"
-                time_display.Position = list(plot_properties.time_location)
+    _configure_annotation_display(
+        time_display,
+        plot_properties.time_location,
+        plot_properties.label_size,
+        is_line_char_view,
+        plot_properties,
+    )
 
-    view.Update()
     # Fix for correct positioning
-    if is_line_char_view:
+    if _update_view(view, defer_update) and is_line_char_view:
         ps.Render(view)
     return annotate_time
 
@@ -759,7 +1102,7 @@ def show_spread_sheet(
     visible_columns: Optional[list[str]] = None,
     sort_by_column: Optional[str] = None,
     invert_sort_order: bool = False,
-    plot_properties: PlotProperties = PlotProperties(),  # noqa: U100
+    plot_properties: Optional[PlotProperties] = None,  # noqa: U100
 ) -> paraview.servermanager.Proxy:
     """
     Create and configure spread sheet view in ParaView.
@@ -815,10 +1158,12 @@ def show_spread_sheet(
                 pass
     else:
         hide_columns = []
-    spread_sheet_view.HiddenColumnLabels = hide_columns
-
-    spread_sheet_view.ColumnToSort = sort_by_column
-    spread_sheet_view.InvertOrder = invert_sort_order
+    ps.SetProperties(
+        spread_sheet_view,
+        HiddenColumnLabels=hide_columns,
+        ColumnToSort=sort_by_column,
+        InvertOrder=invert_sort_order,
+    )
 
     return spread_sheet_view
 
@@ -829,7 +1174,7 @@ def save_screenshot(
     ),
     results_folder: str,
     filename: str,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
 ) -> None:
     """
     Save screenshot of the given line chart view as ``png``.
@@ -844,7 +1189,17 @@ def save_screenshot(
         The base name for the screenshot file (without extension).
     plot_properties
         Additional properties like background transparency.
+
+    See Also
+    --------
+    sapphireppplot.plot_properties.PlotProperties.png_compression_level:
+        Compression level.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
+    _flush_batched_views()
+
     file_path = os.path.join(results_folder, filename + ".png")
     print(f"Save screenshot '{file_path}'")
     ps.SaveScreenshot(
@@ -852,6 +1207,7 @@ def save_screenshot(
         viewOrLayout=view_or_layout,
         location=PARAVIEW_DATA_SERVER_LOCATION,
         TransparentBackground=plot_properties.screenshot_transparent_background,
+        CompressionLevel=str(plot_properties.png_compression_level),
     )
 
 
@@ -861,19 +1217,23 @@ def save_animation(
     ),
     results_folder: str,
     filename: str,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
 ) -> None:
     """
-    Save animation of the given line chart view as series of ``.png`` files.
+    Save animation of the given view or layout.
+
+    Depending on ``plot_properties.animation_format``, the animation is either
+    saved as a series of image files (e.g. ``.png``),
+    or encoded as a single video file (e.g. ``.mp4``).
 
     Parameters
     ----------
     view_or_layout
-        The ParaView view or layout object to capture in the screenshot.
+        The ParaView view or layout object to capture in the animation.
     results_folder
-        The directory path where the screenshot will be saved.
+        The directory path where the animation will be saved.
     filename
-        The base name for the screenshot file (without extension).
+        The base name for the animation file (without extension).
     plot_properties
         Additional properties like background transparency.
 
@@ -881,17 +1241,47 @@ def save_animation(
     --------
     sapphireppplot.plot_properties.PlotProperties.animation_frame_stride:
         Animation frame stride, skip if ``-1``.
+    sapphireppplot.plot_properties.PlotProperties.animation_format:
+        File format of the animation.
+    sapphireppplot.plot_properties.PlotProperties.animation_frame_rate:
+        Frame rate for video formats.
+    sapphireppplot.plot_properties.PlotProperties.png_compression_level:
+        Compression level.
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
     if plot_properties.animation_frame_stride == -1:
         return
-    file_path = os.path.join(results_folder, filename + ".png")
+    _flush_batched_views()
+    save_format = plot_properties.animation_format
+    file_path = os.path.join(results_folder, filename + "." + save_format)
     print(f"Save animation '{file_path}'")
+    options: dict[str, Any] = {
+        "FrameStride": plot_properties.animation_frame_stride,
+    }
+    match save_format:
+        case "png":
+            options["TransparentBackground"] = (
+                plot_properties.animation_transparent_background
+            )
+            options["CompressionLevel"] = str(
+                plot_properties.png_compression_level
+            )
+        case "avi" | "ogv" | "mp4":
+            # Encode all frames into a single video file,
+            # video formats do not support transparency
+            options["FrameRate"] = plot_properties.animation_frame_rate
+        case _:
+            options["TransparentBackground"] = (
+                plot_properties.animation_transparent_background
+            )
+
     ps.SaveAnimation(
         filename=file_path,
         viewOrLayout=view_or_layout,
         location=PARAVIEW_DATA_SERVER_LOCATION,
-        TransparentBackground=plot_properties.animation_transparent_background,
-        FrameStride=plot_properties.animation_frame_stride,
+        **options,
     )
 
 
@@ -901,7 +1291,7 @@ def save_view(
     filename: str,
     save_format: Literal["svg", "pdf", "csv"] | str = "svg",
     fix_axes_titles: bool = False,
-    plot_properties: PlotProperties = PlotProperties(),
+    plot_properties: Optional[PlotProperties] = None,
 ) -> None:
     """
     Save ParaView view as vector graphic or table.
@@ -934,6 +1324,11 @@ def save_view(
     --------
     :pv:`paraview.simple.ExportView <paraview.simple.html#paraview.simple.ExportView>`
     """
+    if plot_properties is None:
+        plot_properties = PlotProperties()
+
+    _flush_batched_views()
+
     if fix_axes_titles:
         view.AxesGrid.YTitle += r"$_{_{_{_{_{_{_{_{_{_{.}}}}}}}}}}$"
         view.AxesGrid.ZTitle += r"$_{_{_{_{_{_{_{_{_{_{.}}}}}}}}}}$"
@@ -1,6 +1,6 @@
 """Transform the solution, e.g. by PlotOverLine or Calculator."""
 
-from typing import cast, Optional, TypeVar, Literal
+from typing import cast, Any, Optional, TypeVar, Literal
 from collections.abc import Sequence
 import os
 import paraview.simple as ps
@@ -10,6 +10,111 @@ from sapphireppplot.pvplot import PARAVIEW_DATA_SERVER_LOCATION
 
 _epsilon_d: float = 1e-10
 PlotPropertiesVar = TypeVar("PlotPropertiesVar", bound=PlotProperties)
+_SourceKey = tuple[Any, ...]
+"""Key of cached filters: filter type, global ID of the input and settings."""
+
+
+def _get_bounds(
+    solution: paraview.servermanager.SourceProxy,
+) -> tuple[float, float, float, float, float, float]:
+    """
+    Get the bounds of the solution from its data information.
+
+    In contrast to ``paraview.servermanager.Fetch()``,
+    this does not transfer the data from the server to the client.
+
+    Parameters
+    ----------
+    solution
+        The data source.
+
+    Returns
+    -------
+    bounds : tuple[float, float, float, float, float, float]
+        The bounds ``(x_min, x_max, y_min, y_max, z_min, z_max)``.
+    """
+    solution.UpdatePipeline()
+    return tuple(solution.GetDataInformation().GetBounds())
+
+
+_axis_index: dict[str, int] = {"x": 0, "y": 1, "z": 2}
+"""Index of the coordinate axes."""
+_sampling_patterns: dict[str, str] = {
+    "uniform": "Sample Uniformly",
+    "center": "Sample At Segment Centers",
+    "boundary": "Sample At Cell Boundaries",
+}
+"""ParaView PlotOverLine sampling pattern of each sampling pattern."""
+_cached_sources: dict[_SourceKey, paraview.servermanager.SourceProxy] = {}
+"""Cache of filters, reused by repeated calls with the same settings."""
+
+
+def _line_end_points(
+    solution: paraview.servermanager.SourceProxy,
+    direction: (
+        Literal["x", "y", "z", "d"]
+        | tuple[tuple[float, float, float], tuple[float, float, float]]
+    ),
+    offset: tuple[float, float, float],
+    x_range: Optional[tuple[float, float]],
+) -> tuple[list[float], list[float]]:
+    """
+    Get start and end point of a line through the solution.
+
+    Parameters
+    ----------
+    solution
+        The data source.
+    direction
+        Direction of the line.
+        Can be either:
+
+        - ``"x"``, ``"y"``, ``"z"`` for a line along coordinate axes.
+        - ``"d"`` for a line along the diagonal.
+        - Tuple with start and end points:
+          ``((x_1,y_1,z_1), (x_2,y_2,z_2))``.
+    offset
+        Offset of the line.
+        Only used for ``direction = "x"/"y"/"z"``.
+    x_range
+        Start (``x_range[0]``) and end-coordinate (``x_range[1]``)
+        for a line along the coordinate axes.
+        Only used for ``direction = "x"/"y"/"z"``.
+
+    Returns
+    -------
+    point_1 : list[float]
+        Start point of the line.
+    point_2 : list[float]
+        End point of the line.
+
+    Raises
+    ------
+    ValueError
+        If the direction is unknown.
+    """
+    if isinstance(direction, (list, tuple)):
+        return list(direction[0]), list(direction[1])
+    if direction != "d" and direction not in _axis_index:
+        raise ValueError(f"Unknown direction {direction}")
+
+    # Get bounds of the data, only needed for lines along axes or diagonal
+    bounds = _get_bounds(solution)
+    if direction == "d":
+        return [bounds[0], bounds[2], bounds[4]], [
+            bounds[1],
+            bounds[3],
+            bounds[5],
+        ]
+
+    axis = _axis_index[direction]
+    point_1 = list(offset)
+    point_2 = list(offset)
+    if x_range:
+        point_1[axis], point_2[axis] = x_range[0], x_range[1]
+    else:
+        point_1[axis], point_2[axis] = bounds[2 * axis], bounds[2 * axis + 1]
+    return point_1, point_2
 
 
 def create_extractor(
@@ -87,16 +192,17 @@ def create_extractor(
         extractor_type, solution, registrationName=extractor_type
     )
     extractor.Enable = 1
-    extractor.Writer.FileName = filename + r"_{timestep:06d}." + file_format
-    extractor.Writer.UseSubdirectory = 0
+    ps.SetProperties(
+        extractor.Writer,
+        FileName=filename + r"_{timestep:06d}." + file_format,
+        UseSubdirectory=0,
+        CompressorType=plot_properties.extracts_compressor,
+        CompressionLevel=plot_properties.extracts_compression_level,
+    )
     # extractor.Trigger.Set(
     #     UseEndTimeStep=0,
     #     Frequency=1,
     # )
-    extractor.Writer.CompressorType = plot_properties.extracts_compressor
-    extractor.Writer.CompressionLevel = (
-        plot_properties.extracts_compression_level
-    )
 
     return extractor
 
@@ -253,6 +359,169 @@ def point_data_to_cell_data(
     return cell_data, plot_properties
 
 
+def _get_cached_source(
+    key: _SourceKey,
+) -> Optional[paraview.servermanager.SourceProxy]:
+    """
+    Get a cached filter, unless it was deleted in the meantime.
+
+    Entries of deleted filters are removed from the cache.
+
+    Parameters
+    ----------
+    key
+        Filter type, global ID of the input and the settings of the filter.
+
+    Returns
+    -------
+    source : SourceProxy or None
+        The cached filter, or ``None`` if there is no valid cached filter.
+    """
+    source = _cached_sources.get(key)
+    if source is None:
+        return None
+    if not paraview.servermanager.ProxyManager().GetProxyName(
+        "sources", source
+    ):
+        del _cached_sources[key]
+        return None
+    return source
+
+
+def _get_plot_over_line(
+    solution: paraview.servermanager.SourceProxy,
+    point_1: list[float],
+    point_2: list[float],
+    plot_properties: PlotProperties,
+) -> paraview.servermanager.SourceProxy:
+    """
+    Get a PlotOverLine filter, reusing a previous one with the same settings.
+
+    Parameters
+    ----------
+    solution
+        The data source.
+    point_1
+        Start point of the line.
+    point_2
+        End point of the line.
+    plot_properties
+        Properties of the solution, like the sampling pattern.
+
+    Returns
+    -------
+    plot_over_line_source : SourceProxy
+        The PlotOverLine source.
+
+    Raises
+    ------
+    ValueError
+        If the sampling pattern is unknown.
+    """
+    if plot_properties.sampling_pattern not in _sampling_patterns:
+        raise ValueError(
+            f"Unknown sampling pattern {plot_properties.sampling_pattern}."
+            + "Use one of `uniform`, `center`, `boundary`"
+        )
+
+    key = (
+        "PlotOverLine",
+        solution.GetGlobalIDAsString(),
+        tuple(point_1),
+        tuple(point_2),
+        plot_properties.sampling_pattern,
+        plot_properties.sampling_resolution,
+    )
+    plot_over_line_source = _get_cached_source(key)
+    if plot_over_line_source is None:
+        # create a new 'Plot Over Line'
+        plot_over_line_source = ps.PlotOverLine(
+            registrationName="PlotOverLine", Input=solution
+        )
+        _cached_sources[key] = plot_over_line_source
+
+    # (Re-)apply the settings, the caller might have changed a cached filter
+    sampling_properties: dict[str, Any] = {
+        "Input": solution,
+        "Point1": point_1,
+        "Point2": point_2,
+        "SamplingPattern": _sampling_patterns[plot_properties.sampling_pattern],
+    }
+    if plot_properties.sampling_resolution:
+        if plot_properties.sampling_pattern == "uniform":
+            sampling_properties["Resolution"] = (
+                plot_properties.sampling_resolution
+            )
+        else:
+            sampling_properties["ComputeTolerance"] = False
+            sampling_properties["Tolerance"] = (
+                plot_properties.sampling_resolution
+            )
+    ps.SetProperties(plot_over_line_source, **sampling_properties)
+    if not plot_properties.sampling_resolution:
+        if plot_properties.sampling_pattern == "uniform":
+            ps.ResetProperty("Resolution", proxy=plot_over_line_source)
+        else:
+            ps.ResetProperty("ComputeTolerance", proxy=plot_over_line_source)
+            ps.ResetProperty("Tolerance", proxy=plot_over_line_source)
+
+    return plot_over_line_source
+
+
+def _get_scale_axes(
+    source: paraview.servermanager.SourceProxy,
+    registration_name: str,
+    result_array_name: str,
+    function: str,
+    result_t_coords: bool = False,
+) -> paraview.servermanager.SourceProxy:
+    """
+    Get a Calculator scaling the axes of `source`, reusing a previous one.
+
+    Parameters
+    ----------
+    source
+        Input of the Calculator.
+    registration_name
+        Name of the Calculator in the pipeline browser.
+    result_array_name
+        Name of the scaled array.
+    function
+        Expression computing the scaled array.
+    result_t_coords
+        Store the result as texture coordinates.
+
+    Returns
+    -------
+    calculator_source : SourceProxy
+        The Calculator.
+    """
+    key = (
+        "Calculator",
+        source.GetGlobalIDAsString(),
+        result_array_name,
+        function,
+        result_t_coords,
+    )
+    calculator_source = _get_cached_source(key)
+    if calculator_source is None:
+        calculator_source = ps.Calculator(
+            registrationName=registration_name, Input=source
+        )
+        _cached_sources[key] = calculator_source
+
+    # (Re-)apply the settings, the caller might have changed a cached filter
+    ps.SetProperties(
+        calculator_source,
+        Input=source,
+        ResultArrayName=result_array_name,
+        Function=function,
+        ResultTCoords=result_t_coords,
+    )
+
+    return calculator_source
+
+
 def plot_over_line(
     solution: paraview.servermanager.SourceProxy,
     direction: (
@@ -269,6 +538,9 @@ def plot_over_line(
     """
     Create and configure plot over line from solution.
 
+    The PlotOverLine filter of a previous call
+    with the same line and sampling settings is reused.
+
     Parameters
     ----------
     solution
@@ -292,17 +564,20 @@ def plot_over_line(
         Divide the x-axes coordinate by this scale.
         The scaled axes will be stored in a variable ``scaled_axes``.
     results_folder
-        The directory path where the data will be saved as ``.csv``.
+        The directory path where the data will be saved.
     filename
         The base name for the saved data file (without extension).
         If no filename is given, the data is not saved.
     plot_properties
-        Properties of the solution, like the sampling pattern.
+        Properties of the solution, like the sampling pattern
+        and the export format.
 
     Returns
     -------
     plot_over_line_source : SourceProxy
         The PlotOverLine source.
+        It is shared with later calls using the same arguments,
+        which reset any settings changed on it.
 
     See Also
     --------
@@ -311,133 +586,49 @@ def plot_over_line(
         Sampling pattern.
     sapphireppplot.plot_properties.PlotProperties.sampling_resolution :
         Sampling resolution.
+    sapphireppplot.plot_properties.PlotProperties.export_format :
+        Export format.
     """
     if offset is None:
         offset = (0.0, 0.0, 0.0)
     if plot_properties is None:
         plot_properties = cast(PlotPropertiesVar, PlotProperties())
 
-    # create a new 'Plot Over Line'
-    plot_over_line_source = ps.PlotOverLine(
-        registrationName="PlotOverLine", Input=solution
+    point_1, point_2 = _line_end_points(solution, direction, offset, x_range)
+    plot_over_line_source = _get_plot_over_line(
+        solution, point_1, point_2, plot_properties
     )
 
-    # Get the bounds in x
-    # Fetch data information from the solution
-    solution_data = paraview.servermanager.Fetch(solution)
-    # Get bounds of the data
-    solution_bounds = solution_data.GetBounds()
-    match direction:
-        case list():
-            plot_over_line_source.Point1 = direction[0]
-            plot_over_line_source.Point2 = direction[1]
-        case tuple():
-            plot_over_line_source.Point1 = direction[0]
-            plot_over_line_source.Point2 = direction[1]
-        case "x":
-            min_x = solution_bounds[0]
-            max_x = solution_bounds[1]
-            if x_range:
-                min_x = x_range[0]
-                max_x = x_range[1]
-            plot_over_line_source.Point1 = [min_x, offset[1], offset[2]]
-            plot_over_line_source.Point2 = [max_x, offset[1], offset[2]]
-        case "y":
-            min_y = solution_bounds[2]
-            max_y = solution_bounds[3]
-            if x_range:
-                min_y = x_range[0]
-                max_y = x_range[1]
-            plot_over_line_source.Point1 = [offset[0], min_y, offset[2]]
-            plot_over_line_source.Point2 = [offset[0], max_y, offset[2]]
-        case "z":
-            min_z = solution_bounds[4]
-            max_z = solution_bounds[5]
-            if x_range:
-                min_z = x_range[0]
-                max_z = x_range[1]
-            plot_over_line_source.Point1 = [offset[0], offset[1], min_z]
-            plot_over_line_source.Point2 = [offset[0], offset[1], max_z]
-        case "d":
-            min_x = solution_bounds[0]
-            max_x = solution_bounds[1]
-            min_y = solution_bounds[2]
-            max_y = solution_bounds[3]
-            min_z = solution_bounds[4]
-            max_z = solution_bounds[5]
-            plot_over_line_source.Point1 = [min_x, min_y, min_z]
-            plot_over_line_source.Point2 = [max_x, max_y, max_z]
-        case _:
-            raise ValueError(f"Unknown direction {direction}")
-
-    # Change SamplingPattern
-    match plot_properties.sampling_pattern:
-        case "uniform":
-            plot_over_line_source.SamplingPattern = "Sample Uniformly"
-            if plot_properties.sampling_resolution:
-                plot_over_line_source.Resolution = (
-                    plot_properties.sampling_resolution
-                )
-        case "center":
-            plot_over_line_source.SamplingPattern = "Sample At Segment Centers"
-            if plot_properties.sampling_resolution:
-                plot_over_line_source.ComputeTolerance = False
-                plot_over_line_source.Tolerance = (
-                    plot_properties.sampling_resolution
-                )
-        case "boundary":
-            plot_over_line_source.SamplingPattern = "Sample At Cell Boundaries"
-            if plot_properties.sampling_resolution:
-                plot_over_line_source.ComputeTolerance = False
-                plot_over_line_source.Tolerance = (
-                    plot_properties.sampling_resolution
-                )
-        case _:
-            raise ValueError(
-                f"Unknown sampling pattern {plot_properties.sampling_pattern}."
-                + "Use one of `uniform`, `center`, `boundary`"
-            )
-
     if x_axes_scale is not None:
-        plot_over_line_source = ps.Calculator(
-            registrationName="ScaleAxes", Input=plot_over_line_source
-        )
-        plot_over_line_source.ResultArrayName = "scaled_axes"
-
         x_array_name = "arc_length"
-        match direction:
-            case list():
-                x_array_name = "arc_length"
-            case tuple():
-                x_array_name = "arc_length"
-            case "x":
-                x_array_name = "coordsX"
-            case "y":
-                x_array_name = "coordsY"
-            case "z":
-                x_array_name = "coordsZ"
-            case "d":
-                x_array_name = "arc_length"
-            case _:
-                raise ValueError(f"Unknown direction {direction}")
-        plot_over_line_source.Function = f"{x_array_name} / {x_axes_scale}"
+        if isinstance(direction, str) and direction in _axis_index:
+            x_array_name = "coords" + direction.upper()
+        plot_over_line_source = _get_scale_axes(
+            plot_over_line_source,
+            "ScaleAxes",
+            "scaled_axes",
+            f"{x_array_name} / {x_axes_scale}",
+        )
 
     # Save data if a file is given
     if filename:
-        file_path = os.path.join(results_folder, filename + ".csv")
+        file_path = os.path.join(
+            results_folder, filename + "." + plot_properties.export_format
+        )
         print(f"Save data '{file_path}'")
 
-        series_names = []
-        if plot_properties.series_names:
-            series_names += plot_properties.series_names
-        if (
-            isinstance(direction, tuple)
-            or isinstance(direction, list)
-            or direction == "d"
-        ):
-            series_names += ["arc_length"]
+        series_names = list(plot_properties.series_names)
+        if not isinstance(direction, str) or direction == "d":
+            series_names.append("arc_length")
         if x_axes_scale is not None:
-            series_names += ["scaled_axes"]
+            series_names.append("scaled_axes")
+
+        format_options: dict[str, Any] = {}
+        if plot_properties.export_format == "csv":
+            format_options = {
+                "UseScientificNotation": 1,
+                "Precision": plot_properties.export_precision,
+            }
 
         ps.SaveData(
             filename=file_path,
@@ -445,11 +636,11 @@ def plot_over_line(
             location=PARAVIEW_DATA_SERVER_LOCATION,
             ChooseArraysToWrite=(1 if plot_properties.series_names else 0),
             PointDataArrays=series_names,
-            UseScientificNotation=1,
-            Precision=plot_properties.export_precision,
+            **format_options,
         )
-
-    plot_over_line_source.UpdatePipeline()
+    else:
+        # SaveData already updates the pipeline
+        plot_over_line_source.UpdatePipeline()
 
     return plot_over_line_source
 
@@ -464,6 +655,8 @@ def slice_plane(
     """
     Slice a 2D plane from a 3D solution.
 
+    The Slice filter of a previous call with the same plane is reused.
+
     Parameters
     ----------
     solution
@@ -486,6 +679,8 @@ def slice_plane(
     -------
     slice_plane : SourceProxy
         The 2D slice of the solution.
+        It is shared with later calls using the same arguments,
+        which reset any settings changed on it.
 
     See Also
     --------
@@ -502,16 +697,35 @@ def slice_plane(
     if plot_properties is None:
         plot_properties = cast(PlotPropertiesVar, PlotProperties())
 
-    # create a new 'Slice'
-    sliced_plane = ps.Slice(registrationName="SlicePlane", Input=solution)
-
-    sliced_plane.Crinkleslice = crinkle_slice
-    sliced_plane.SliceType.Normal = list(normal)
-    sliced_plane.SliceType.Origin = list(origin)
-    # Use small offset to ensure data is within slice plane
-    sliced_plane.SliceType.Offset = _epsilon_d
+    key = (
+        "Slice",
+        solution.GetGlobalIDAsString(),
+        tuple(normal),
+        tuple(origin),
+        crinkle_slice,
+    )
+    sliced_plane = _get_cached_source(key)
+    if sliced_plane is None:
+        # create a new 'Slice'
+        sliced_plane = ps.Slice(registrationName="SlicePlane", Input=solution)
+        ps.HideInteractiveWidgets(proxy=sliced_plane.SliceType)
+        _cached_sources[key] = sliced_plane
+
+    # (Re-)apply the settings, the caller might have changed a cached filter
+    ps.SetProperties(
+        sliced_plane,
+        Input=solution,
+        SliceType="Plane",
+        Crinkleslice=crinkle_slice,
+    )
+    ps.SetProperties(
+        sliced_plane.SliceType,
+        Normal=list(normal),
+        Origin=list(origin),
+        # Use small offset to ensure data is within slice plane
+        Offset=_epsilon_d,
+    )
 
-    ps.HideInteractiveWidgets(proxy=sliced_plane.SliceType)
     sliced_plane.UpdatePipeline()
 
     return sliced_plane
@@ -556,13 +770,17 @@ def probe_location(
         Input=solution,
         ProbeType="Fixed Radius Point Source",
     )
-    probe_location_source.ProbeType.Center = list(point)
-    probe_location_source.ProbeType.Radius = 0
+    ps.SetProperties(
+        probe_location_source.ProbeType, Center=list(point), Radius=0
+    )
     ps.HideInteractiveWidgets(proxy=probe_location_source.ProbeType)
 
     if plot_properties.sampling_resolution:
-        probe_location_source.ComputeTolerance = False
-        probe_location_source.Tolerance = plot_properties.sampling_resolution
+        ps.SetProperties(
+            probe_location_source,
+            ComputeTolerance=False,
+            Tolerance=plot_properties.sampling_resolution,
+        )
 
     if plot_properties.series_names:
         plot_properties.series_names += ["Point Coordinates"]
@@ -675,45 +893,46 @@ def plot_over_time(
         OnlyReportSelectionStatistics=0,
         FieldAssociation=plot_properties.data_type.capitalize(),
     )
-    plot_over_time_source.UpdatePipeline()
 
-    plot_properties.labels = {}
-    plot_properties.line_colors = {}
-    plot_properties.line_styles = {}
-    for key in plot_properties_in.labels.keys():
-        plot_properties.labels[key + " (id=0)"] = plot_properties_in.labels[key]
-    for key in plot_properties_in.line_colors.keys():
-        plot_properties.line_colors[key + " (id=0)"] = (
-            plot_properties_in.line_colors[key]
-        )
-    for key in plot_properties_in.line_styles.keys():
-        plot_properties.line_styles[key + " (id=0)"] = (
-            plot_properties_in.line_styles[key]
-        )
+    # PlotDataOverTime appends the point id to the series names
+    plot_properties.labels = {
+        key + " (id=0)": label
+        for key, label in plot_properties_in.labels.items()
+    }
+    plot_properties.line_colors = {
+        key + " (id=0)": color
+        for key, color in plot_properties_in.line_colors.items()
+    }
+    plot_properties.line_styles = {
+        key + " (id=0)": style
+        for key, style in plot_properties_in.line_styles.items()
+    }
 
     if plot_properties.series_names:
-        plot_properties.series_names += ["Time"]
+        plot_properties.series_names.append("Time")
     if plot_properties.labels:
         plot_properties.labels["Time (id=0)"] = r"$t$"
     plot_properties.bottom_axis_labels = {}
     plot_properties.data_type = "ROWS"
 
     if t_axes_scale is not None:
-        plot_over_time_source = ps.Calculator(
-            registrationName="ScaleTimeAxes", Input=plot_over_time_source
-        )
-        plot_over_time_source.ResultArrayName = "scaled_t_axes"
-        plot_over_time_source.ResultTCoords = True
-
         x_array_name = "Time"
-        plot_over_time_source.Function = f"{x_array_name} / {t_axes_scale}"
-        plot_over_time_source.UpdatePipeline()
+        plot_over_time_source = _get_scale_axes(
+            plot_over_time_source,
+            "ScaleTimeAxes",
+            "scaled_t_axes",
+            f"{x_array_name} / {t_axes_scale}",
+            result_t_coords=True,
+        )
 
         if plot_properties.series_names:
-            plot_properties.series_names += ["scaled_t_axes"]
+            plot_properties.series_names.append("scaled_t_axes")
         if plot_properties.labels:
             plot_properties.labels["scaled_t_axes (id=0)"] = r"$t / t_0$"
 
+    # Run the sweep over all time steps only once, for the final filter
+    plot_over_time_source.UpdatePipeline()
+
     # Save data if a file is given
     if filename:
         file_path = os.path.join(results_folder, filename + ".csv")
@@ -742,6 +961,8 @@ def clip_area(
     """
     Clip area from solution.
 
+    The Clip filter of a previous call with the same ranges is reused.
+
     Parameters
     ----------
     solution
@@ -759,6 +980,8 @@ def clip_area(
     -------
     clipped_solution : SourceProxy
         The clipped source.
+        It is shared with later calls using the same arguments,
+        which reset any settings changed on it.
 
     See Also
     --------
@@ -767,20 +990,17 @@ def clip_area(
     if plot_properties is None:
         plot_properties = cast(PlotPropertiesVar, PlotProperties())
 
-    clipped_solution = ps.Clip(registrationName="Clip", Input=solution)
-
-    clipped_solution.ClipType = "Box"
-    clipped_solution.Crinkleclip = 1
-
-    solution_data = paraview.servermanager.Fetch(solution)
-    bounds = solution_data.GetBounds()
-    if x_range is None:
-        x_range = (bounds[0], bounds[1])
-    if y_range is None:
-        y_range = (bounds[2], bounds[3])
-    if z_range is None:
-        z_range = (bounds[4], bounds[5])
-
+    # Get bounds of the data, only needed if a range is missing
+    if x_range is None or y_range is None or z_range is None:
+        bounds = _get_bounds(solution)
+        if x_range is None:
+            x_range = (bounds[0], bounds[1])
+        if y_range is None:
+            y_range = (bounds[2], bounds[3])
+        if z_range is None:
+            z_range = (bounds[4], bounds[5])
+
+    # Use small epsilon for flat ranges to capture cells inside box
     if x_range[0] == x_range[1]:
         x_range = (x_range[0] - _epsilon_d, x_range[1] + _epsilon_d)
     if y_range[0] == y_range[1]:
@@ -788,15 +1008,35 @@ def clip_area(
     if z_range[0] == z_range[1]:
         z_range = (z_range[0] - _epsilon_d, z_range[1] + _epsilon_d)
 
-    # Use small epsilon in z to capture cells inside box
-    clipped_solution.ClipType.Position = [x_range[0], y_range[0], z_range[0]]
-    clipped_solution.ClipType.Length = [
-        x_range[1] - x_range[0],
-        y_range[1] - y_range[0],
-        z_range[1] - z_range[0],
-    ]
+    key = (
+        "Clip",
+        solution.GetGlobalIDAsString(),
+        tuple(x_range),
+        tuple(y_range),
+        tuple(z_range),
+    )
+    clipped_solution = _get_cached_source(key)
+    if clipped_solution is None:
+        clipped_solution = ps.Clip(
+            registrationName="Clip", Input=solution, ClipType="Box"
+        )
+        ps.HideInteractiveWidgets(proxy=clipped_solution.ClipType)
+        _cached_sources[key] = clipped_solution
+
+    # (Re-)apply the settings, the caller might have changed a cached filter
+    ps.SetProperties(
+        clipped_solution, Input=solution, ClipType="Box", Crinkleclip=1
+    )
+    ps.SetProperties(
+        clipped_solution.ClipType,
+        Position=[x_range[0], y_range[0], z_range[0]],
+        Length=[
+            x_range[1] - x_range[0],
+            y_range[1] - y_range[0],
+            z_range[1] - z_range[0],
+        ],
+    )
 
-    ps.HideInteractiveWidgets(proxy=clipped_solution.ClipType)
     clipped_solution.UpdatePipeline()
 
     return clipped_solution
@@ -811,6 +1051,9 @@ def contour_lines(
     """
     Create contour lines of a quantity from the solution.
 
+    The Contour filter of a previous call
+    with the same quantity and isosurfaces is reused.
+
     The ``contour_lines`` can be added to an existing ``render_view``
     using ``pvplot.show_overlay_2d()``.
 
@@ -829,6 +1072,8 @@ def contour_lines(
     -------
     contour_source : SourceProxy
         The Contour source.
+        It is shared with later calls using the same arguments,
+        which reset any settings changed on it.
     plot_properties : PlotPropertiesVar
         The PlotProperties for contour lines.
 
@@ -841,13 +1086,25 @@ def contour_lines(
     plot_properties = plot_properties_in.copy()
     plot_properties.representation_type = "GeometryRepresentation"
 
-    # create a new 'Contour'
-    contour_source = ps.Contour(registrationName="Contour", Input=solution)
-
-    contour_source.ContourBy = ["POINTS", quantity]
-
-    # Properties modified on contour_source
-    contour_source.Isosurfaces = isosurfaces
+    key = (
+        "Contour",
+        solution.GetGlobalIDAsString(),
+        quantity,
+        tuple(isosurfaces),
+    )
+    contour_source = _get_cached_source(key)
+    if contour_source is None:
+        # create a new 'Contour'
+        contour_source = ps.Contour(registrationName="Contour", Input=solution)
+        _cached_sources[key] = contour_source
+
+    # (Re-)apply the settings, the caller might have changed a cached filter
+    ps.SetProperties(
+        contour_source,
+        Input=solution,
+        ContourBy=["POINTS", quantity],
+        Isosurfaces=isosurfaces,
+    )
 
     contour_source.UpdatePipeline()
 
@@ -869,6 +1126,9 @@ def stream_tracer(
     """
     Create stream tracer of a quantity from the solution.
 
+    The StreamTracer filter of a previous call
+    with the same seed line and settings is reused.
+
     The ``stream_tracer`` can be added to an existing ``render_view``
     using ``pvplot.show_overlay_2d()``.
 
@@ -902,6 +1162,8 @@ def stream_tracer(
     -------
     stream_tracer_source : SourceProxy
         The StreamTracer source.
+        It is shared with later calls using the same arguments,
+        which reset any settings changed on it.
     plot_properties : PlotPropertiesVar
         The PlotProperties for StreamTracer.
 
@@ -923,75 +1185,50 @@ def stream_tracer(
         plot_properties_in = cast(PlotPropertiesVar, PlotProperties())
     plot_properties = plot_properties_in.copy()
 
-    # create a new 'Stream Tracer'
-    stream_tracer_source = ps.StreamTracer(
-        registrationName="StreamTracer",
-        Input=solution,
-        SeedType="Line",
+    point_1, point_2 = _line_end_points(solution, direction, offset, x_range)
+    key = (
+        "StreamTracer",
+        solution.GetGlobalIDAsString(),
+        plot_properties.data_type,
+        quantity,
+        tuple(point_1),
+        tuple(point_2),
+        n_lines,
+        plot_properties.stream_tracer_maximum_error,
+        plot_properties.stream_tracer_minimum_step,
+        plot_properties.stream_tracer_initial_step,
+        plot_properties.stream_tracer_maximum_step,
     )
-    stream_tracer_source.Vectors = [plot_properties.data_type, quantity]
-
-    # Get the bounds in x
-    # Fetch data information from the solution
-    solution_data = paraview.servermanager.Fetch(solution)
-    # Get bounds of the data
-    solution_bounds = solution_data.GetBounds()
-    match direction:
-        case list():
-            stream_tracer_source.SeedType.Point1 = direction[0]
-            stream_tracer_source.SeedType.Point2 = direction[1]
-        case tuple():
-            stream_tracer_source.SeedType.Point1 = direction[0]
-            stream_tracer_source.SeedType.Point2 = direction[1]
-        case "x":
-            min_x = solution_bounds[0]
-            max_x = solution_bounds[1]
-            if x_range:
-                min_x = x_range[0]
-                max_y = x_range[1]
-            stream_tracer_source.SeedType.Point1 = [min_x, offset[1], offset[2]]
-            stream_tracer_source.SeedType.Point2 = [max_x, offset[1], offset[2]]
-        case "y":
-            min_y = solution_bounds[2]
-            max_y = solution_bounds[3]
-            if x_range:
-                min_y = x_range[0]
-                max_y = x_range[1]
-            stream_tracer_source.SeedType.Point1 = [offset[0], min_y, offset[2]]
-            stream_tracer_source.SeedType.Point2 = [offset[0], max_y, offset[2]]
-        case "z":
-            min_z = solution_bounds[4]
-            max_z = solution_bounds[5]
-            if x_range:
-                min_z = x_range[0]
-                max_z = x_range[1]
-            stream_tracer_source.SeedType.Point1 = [offset[0], offset[1], min_z]
-            stream_tracer_source.SeedType.Point2 = [offset[0], offset[1], max_z]
-        case "d":
-            min_x = solution_bounds[0]
-            max_x = solution_bounds[1]
-            min_y = solution_bounds[2]
-            max_y = solution_bounds[3]
-            min_z = solution_bounds[4]
-            max_z = solution_bounds[5]
-            stream_tracer_source.SeedType.Point1 = [min_x, min_y, min_z]
-            stream_tracer_source.SeedType.Point2 = [max_x, max_y, max_z]
-        case _:
-            raise ValueError(f"Unknown direction {direction}")
-
-    stream_tracer_source.SeedType.Resolution = n_lines
+    stream_tracer_source = _get_cached_source(key)
+    if stream_tracer_source is None:
+        # create a new 'Stream Tracer'
+        stream_tracer_source = ps.StreamTracer(
+            registrationName="StreamTracer",
+            Input=solution,
+            SeedType="Line",
+        )
+        _cached_sources[key] = stream_tracer_source
 
-    stream_tracer_source.MaximumError = (
-        plot_properties.stream_tracer_maximum_error
-    )
-    stream_tracer_source.MinimumStepLength = (
-        plot_properties.stream_tracer_minimum_step
+    # (Re-)apply the settings, the caller might have changed a cached filter
+    ps.SetProperties(
+        stream_tracer_source,
+        Input=solution,
+        SeedType="Line",
+        Vectors=[plot_properties.data_type, quantity],
     )
-    stream_tracer_source.InitialStepLength = (
-        plot_properties.stream_tracer_initial_step
+    ps.SetProperties(
+        stream_tracer_source.SeedType,
+        Point1=point_1,
+        Point2=point_2,
+        Resolution=n_lines,
     )
-    stream_tracer_source.MaximumStepLength = (
-        plot_properties.stream_tracer_maximum_step
+
+    ps.SetProperties(
+        stream_tracer_source,
+        MaximumError=plot_properties.stream_tracer_maximum_error,
+        MinimumStepLength=plot_properties.stream_tracer_minimum_step,
+        InitialStepLength=plot_properties.stream_tracer_initial_step,
+        MaximumStepLength=plot_properties.stream_tracer_maximum_step,
     )
 
     stream_tracer_source.UpdatePipeline()
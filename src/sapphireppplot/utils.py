@@ -2,6 +2,8 @@
 
 import sys
 import os
+import copy
+import functools
 from typing import cast, Any, Dict
 from collections.abc import Sequence
 from matplotlib.typing import ColorType
@@ -68,10 +70,13 @@ def get_results_folder(
     return results_folder
 
 
-def prm_to_dict(prm_lines: list[str]) -> ParamDict:
+def prm_to_dict(prm_lines: Sequence[str]) -> ParamDict:
     """
     Convert parameter file to a dict.
 
+    The parsed dicts are cached,
+    so parsing the same parameter file repeatedly is cheap.
+
     Parameters
     ----------
     prm_lines
@@ -84,6 +89,42 @@ def prm_to_dict(prm_lines: list[str]) -> ParamDict:
         Values are always given as strings.
         Subsections are given as dicts.
     """
+    return copy.deepcopy(_prm_lines_to_dict(tuple(prm_lines)))
+
+
+@functools.lru_cache(maxsize=32)
+def _prm_lines_to_dict(prm_lines: tuple[str, ...]) -> ParamDict:
+    """
+    Convert parameter file to a dict, cached by the lines of the file.
+
+    Parameters
+    ----------
+    prm_lines
+        Lines in the parameter file.
+
+    Returns
+    -------
+    prm_dict : ParamDict
+        Dictionary representing the parameter file structure.
+    """
+    return _parse_prm_lines(list(prm_lines))
+
+
+def _parse_prm_lines(prm_lines: list[str]) -> ParamDict:
+    """
+    Parse lines of a parameter file, consuming the parsed lines.
+
+    Parameters
+    ----------
+    prm_lines
+        List of line in the parameter file.
+        Parsed lines are removed from the list.
+
+    Returns
+    -------
+    prm_dict : ParamDict
+        Dictionary representing the parameter (sub-)section.
+    """
     prm_dict: ParamDict = {}
 
     while prm_lines:
@@ -98,7 +139,7 @@ def prm_to_dict(prm_lines: list[str]) -> ParamDict:
             prm_dict[key_value[0].strip()] = key_value[1].strip()
         elif line.startswith("subsection "):
             subsection = line.removeprefix("subsection ")
-            prm_dict[subsection] = prm_to_dict(prm_lines)
+            prm_dict[subsection] = _parse_prm_lines(prm_lines)
         elif line == "end":
             return prm_dict
         else:
@@ -107,6 +148,18 @@ def prm_to_dict(prm_lines: list[str]) -> ParamDict:
     return prm_dict
 
 
+def clear_prm_cache() -> None:
+    """
+    Clear the cache of parsed parameter files.
+
+    See Also
+    --------
+    prm_to_dict : Convert parameter file to a dict.
+    sapphireppplot.pvload.invalidate_caches : Clear all loading caches.
+    """
+    _prm_lines_to_dict.cache_clear()
+
+
 def match_index(list_in: Sequence[Any], target: Any) -> int:
     """
     Find index ``i`` where ``list_in[i] = target``.
@@ -132,7 +132,7 @@ def load_probe_location_surface(
     results_folder: str,
     prm: ParamDict,
     point_id: int = 0,
-    plot_properties_in: PlotProperties = PlotProperties(),
+    plot_properties_in: Optional[PlotProperties] = None,
 ) -> tuple[paraview.servermanager.SourceProxy, list[float], PlotProperties]:
     """
     Load surface plot of phase space distribution at a probed location.
@@ -169,6 +169,8 @@ def load_probe_location_surface(
     :ps:`TableToPoints` : Convert table to point data.
     :ps:`PointVolumeInterpolator` : Convert point cloud to grid data.
     """
+    if plot_properties_in is None:
+        plot_properties_in = PlotProperties()
     plot_properties = plot_properties_in.copy()
     plot_properties.series_names = ["f"]
     plot_properties.labels = {"f": r"$f$"}
@@ -230,7 +232,7 @@ def load_probe_location_spherical_density(
     prm: ParamDict,
     point_id: int = 0,
     resolution: int = 100,
-    plot_properties_in: PlotProperties = PlotProperties(),
+    plot_properties_in: Optional[PlotProperties] = None,
 ) -> tuple[paraview.servermanager.SourceProxy, list[float], PlotProperties]:
     """
     Load spherical density map of phase space distribution at a probed location.
@@ -275,6 +277,8 @@ def load_probe_location_spherical_density(
     :ps:`PointVolumeInterpolator` : Convert point cloud to grid data.
     :ps:`Slice` : Slice sphere from volume data.
     """
+    if plot_properties_in is None:
+        plot_properties_in = PlotProperties()
     plot_properties = plot_properties_in.copy()
     plot_properties.series_names = ["f"]
     plot_properties.labels = {"f": r"$f$"}